@@ -0,0 +1,66 @@
+"""
+엔트리포인트 import 시간 점검 (python -X importtime 기반)
+
+    python -m benchmarks.bench_import_time
+
+import_time_budget.json의 모듈별 예산(ms)을 넘거나, import 시점에
+무거운 의존성(selenium, torch, matplotlib 등)이 로딩되면 종료 코드 1을 반환한다.
+"""
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'import_time_budget.json')
+
+
+def measure(module, repeat=3):
+    """
+    새 인터프리터에서 module을 import하고 (총 시간 ms, 로딩된 최상위 패키지 집합) 반환.
+    디스크 캐시 영향을 줄이기 위해 repeat번 중 최솟값을 쓴다.
+    """
+    best, loaded = None, set()
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"{module} import 실패:\n{proc.stderr[-2000:]}")
+
+        total_us, modules = 0, set()
+        for line in proc.stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if not name.startswith('  '):  # 최상위 import만 합산 (들여쓰기 = 중첩 import)
+                total_us += int(cumulative)
+            modules.add(name.strip().split('.')[0])
+        elapsed = total_us / 1000
+        if best is None or elapsed < best:
+            best, loaded = elapsed, modules
+    return best, loaded
+
+
+def main():
+    with open(BUDGET_PATH, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    failed = False
+    for module, budget in config['budgets_ms'].items():
+        elapsed, loaded = measure(module)
+        heavy = sorted(set(config['forbidden_at_import']) & loaded)
+        ok = elapsed <= budget and not heavy
+        failed |= not ok
+        status = '✅' if ok else '❌'
+        print(f"{status} {module:<52} {elapsed:8.1f} ms (예산 {budget} ms)")
+        if heavy:
+            print(f"   ↳ import 시점에 로딩된 무거운 의존성: {', '.join(heavy)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
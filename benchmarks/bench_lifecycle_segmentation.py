@@ -0,0 +1,59 @@
+"""
+생애주기 단계 분할 벤치마크: 밈 × 일 행렬 일괄 처리 vs 밈별 루프
+
+    python -m benchmarks.bench_lifecycle_segmentation --memes 500 --days 365
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.analyzers.selenium_twitter_lifecycle_analyzer import segment_lifecycles
+
+
+def synthetic_lifecycles(n_memes, n_days, seed=42):
+    # ✅ 밈마다 시작일/최고점/폭이 다른 종 모양 곡선 + 포아송 잡음
+    rng = np.random.default_rng(seed)
+    days = np.arange(n_days)
+    onset = rng.integers(0, n_days // 2, size=(n_memes, 1))
+    width = rng.uniform(5, 40, size=(n_memes, 1))
+    height = rng.uniform(10, 500, size=(n_memes, 1))
+    curve = height * np.exp(-((days - onset - 2 * width) / width) ** 2)
+    curve[days < onset] = 0
+    return rng.poisson(curve).astype(float)
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="생애주기 단계 분할 벤치마크")
+    parser.add_argument('--memes', type=int, default=500)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    counts = synthetic_lifecycles(args.memes, args.days)
+
+    batched = segment_lifecycles(counts)
+    looped = [segment_lifecycles(row) for row in counts]
+    for key in ('growth_start', 'peak_start', 'peak_end', 'dormancy_start'):
+        assert np.array_equal(batched[key], np.array([seg[key][0] for seg in looped])), key
+
+    t_batch = best_of(lambda: segment_lifecycles(counts), args.repeat)
+    t_loop = best_of(lambda: [segment_lifecycles(row) for row in counts], args.repeat)
+
+    print(f"밈 {args.memes}개 × {args.days}일")
+    print(f"  일괄 처리 : {t_batch * 1000:8.2f} ms")
+    print(f"  밈별 루프 : {t_loop * 1000:8.2f} ms")
+    print(f"  속도 향상 : {t_loop / t_batch:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
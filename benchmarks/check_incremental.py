@@ -0,0 +1,90 @@
+"""
+누적 분석(analyze_incremental / analyze_approximate) 정합성 검사
+
+    python -m benchmarks.check_incremental
+
+스냅샷을 순서대로 analyze_incremental / analyze_approximate(CSV 스트리밍)에 넣은 결과가
+같은 스냅샷들을 url로 중복 제거(먼저 수집된 행 유지)한 합집합에 대한 analyze()와 같은지 확인한다.
+  - data/raw/에 스냅샷이 2개 이상인 밈 (실제 수집 데이터)
+  - 서로 겹치고 시간순이 아닌 합성 스냅샷 (benchmarks.synthetic)
+하나라도 다르면 종료 코드 1을 반환한다.
+"""
+import glob
+import os
+import re
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import generate_tweets
+from config.config import RAW_DATA_DIR
+from src.analyzers.selenium_twitter_lifecycle_analyzer import SeleniumTwitterLifecycleAnalyzer
+from src.preprocessors.selenium_twitter_preprocessor import SeleniumTwitterPreprocessor
+
+
+def raw_snapshots():
+    # ✅ twitter_<밈>_<YYYYMMDD>_<HHMMSS>.csv 를 밈별로 묶어 수집 순서대로 반환
+    groups = {}
+    for path in sorted(glob.glob(os.path.join(RAW_DATA_DIR, 'twitter_*.csv'))):
+        match = re.match(r'twitter_(.+)_\d{8}_\d{6}\.csv$', os.path.basename(path))
+        if match:
+            groups.setdefault(match.group(1), []).append(path)
+    return {meme: paths for meme, paths in groups.items() if len(paths) > 1}
+
+
+def synthetic_snapshots(n_snapshots=4, rows=5000, seed=7):
+    # ✅ 한 모집단에서 무작위 순서로 겹치게 뽑은 스냅샷 (뒤 스냅샷에 더 오래된 트윗이 섞이도록)
+    population = generate_tweets(rows, seed=seed)
+    rng = np.random.default_rng(seed)
+    return [population.iloc[np.sort(rng.choice(rows, size=rows // 2, replace=False))].copy()
+            for _ in range(n_snapshots)]
+
+
+def compare(meme_name, snapshots):
+    preprocessor = SeleniumTwitterPreprocessor()
+    snapshots = [preprocessor.preprocess(df) for df in snapshots]
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        analyzer = SeleniumTwitterLifecycleAnalyzer(save_dir=state_dir)
+        for i, df in enumerate(snapshots):
+            incremental, _, _ = analyzer.analyze_incremental(df.copy(), meme_name, state_dir)
+            path = os.path.join(state_dir, f"snapshot_{i}.csv")
+            df.to_csv(path, index=False)
+            approximate, _, _ = analyzer.analyze_approximate(path, meme_name, state_dir, chunksize=100)
+
+        union = pd.concat(snapshots, ignore_index=True).drop_duplicates('url', keep='first')
+        union['date'] = pd.to_datetime(union['date'])
+        batch, _, _ = analyzer.analyze(union, meme_name)
+
+    mismatches = []
+    for mode, metrics in (('누적', incremental), ('근사', approximate)):
+        for key, expected in batch.items():
+            actual = metrics.get(key)
+            if isinstance(expected, (int, float, np.number)) and not isinstance(expected, bool):
+                same = np.isclose(actual, expected, rtol=1e-9, equal_nan=True)
+            else:
+                same = actual == expected
+            if not same:
+                mismatches.append(f"{key}: {mode} {actual!r} / 일괄 {expected!r}")
+    return mismatches
+
+
+def main():
+    cases = {meme: [pd.read_csv(path) for path in paths] for meme, paths in raw_snapshots().items()}
+    cases['synthetic'] = synthetic_snapshots()
+
+    failed = False
+    for meme, snapshots in cases.items():
+        mismatches = compare(meme, snapshots)
+        status = '일치' if not mismatches else '불일치'
+        print(f"\n🔎 {meme}: 스냅샷 {len(snapshots)}개 → {status}")
+        for line in mismatches:
+            print(f"  ❌ {line}")
+        failed |= bool(mismatches)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
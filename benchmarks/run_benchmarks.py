@@ -0,0 +1,161 @@
+"""
+파이프라인 벤치마크 스위트 (합성 데이터 기반, seed 고정)
+
+    python -m benchmarks.run_benchmarks                       # 10k, 100k 행
+    python -m benchmarks.run_benchmarks --sizes 10000 100000 1000000
+    python -m benchmarks.run_benchmarks --update-baseline     # 기준값 갱신
+
+각 단계의 최소 실행 시간(초)을 benchmarks/baseline.json과 비교하고,
+기준보다 tolerance 이상 느려진 항목, 실행 중 예외가 난 항목, 기준값에는 있는데 결과에 없는 항목
+(또는 그 반대)이 있으면 종료 코드 1을 반환한다.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.synthetic import generate_tweets, StubEmbedder
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+PLOTS = [
+    'plot_daily_post_trend', 'plot_engagement_distribution', 'plot_heatmap_by_day_hour',
+    'plot_wordcloud', 'plot_top_hashtags', 'plot_likes_vs_views', 'plot_likes_vs_retweets',
+    'plot_survival_curve', 'plot_likes_views_trend', 'plot_retweet_trend', 'plot_like_rate_distribution',
+]
+
+
+def best_of(func, make_input, repeat):
+    # ✅ 입력 준비(복사) 시간은 제외하고 repeat번 중 최솟값
+    timings = []
+    for _ in range(repeat):
+        data = make_input()
+        start = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_size(n_rows, repeat, skip_plots):
+    import pandas as pd
+    from src.preprocessors.selenium_twitter_preprocessor import SeleniumTwitterPreprocessor
+    from src.analyzers.selenium_twitter_lifecycle_analyzer import SeleniumTwitterLifecycleAnalyzer
+
+    print(f"\n📦 {n_rows:,}행 합성 데이터 생성 중...")
+    raw = generate_tweets(n_rows)
+    preprocessor = SeleniumTwitterPreprocessor(embedder=StubEmbedder())
+    processed = preprocessor.preprocess(raw.copy())
+    with_last_seen = preprocessor.estimate_last_seen(processed.copy())
+
+    results = {}
+
+    def run(name, func, make_input):
+        try:
+            results[name] = round(best_of(func, make_input, repeat), 4)
+            print(f"  {name:<40} {results[name]:9.4f} s")
+        except Exception as e:  # 나머지 항목은 계속 측정하고, 실패는 None으로 남겨 비교 단계에서 실패 처리
+            results[name] = None
+            print(f"  {name:<40} 실패 ({type(e).__name__}: {e})")
+
+    run('preprocess', preprocessor.preprocess, lambda: raw.copy())
+    run('estimate_last_seen', preprocessor.estimate_last_seen, lambda: processed.copy())
+    run('perform_clustering', preprocessor.perform_clustering, lambda: processed.copy())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        analyzer = SeleniumTwitterLifecycleAnalyzer(save_dir=tmp)
+        analysis_input = processed.assign(date=pd.to_datetime(processed['date']))
+        run('analyze', lambda df: analyzer.analyze(df, 'benchmark'), lambda: analysis_input.copy())
+
+        if not skip_plots:
+            import matplotlib
+            matplotlib.use('Agg')
+            from src.visualizers.selenium_twitter_visualizer import SeleniumTwitterVisualizer
+
+            visualizer = SeleniumTwitterVisualizer(output_dir=tmp)
+            for name in PLOTS:
+                run(name, getattr(visualizer, name), lambda: with_last_seen.copy())
+    return results
+
+
+def failed_cases(results):
+    return [(size, name) for size, cases in results.items() for name, seconds in cases.items() if seconds is None]
+
+
+def compare(results, baseline, tolerance, skipped=()):
+    # ✅ 기준 대비 비율 출력, 회귀/실패/누락 항목 목록 반환 (ratio가 None이면 실패 또는 누락)
+    regressions = []
+    print(f"\n📊 기준값 비교 (허용 오차 +{tolerance:.0%})")
+    for size, cases in results.items():
+        base_cases = baseline.get('results', {}).get(size, {})
+        for name in base_cases:
+            if name not in cases and name not in skipped:
+                regressions.append((size, name, None))
+                print(f"  ❌ {size:>8} {name:<40} 결과 없음")
+        for name, seconds in cases.items():
+            if seconds is None:
+                regressions.append((size, name, None))
+                print(f"  ❌ {size:>8} {name:<40} 실패")
+                continue
+            if name not in base_cases:
+                regressions.append((size, name, None))
+                print(f"  ❌ {size:>8} {name:<40} 기준값 없음 (--update-baseline 필요)")
+                continue
+            ratio = seconds / base_cases[name] if base_cases[name] else float('inf')
+            flag = '❌' if ratio > 1 + tolerance else '✅'
+            if flag == '❌':
+                regressions.append((size, name, ratio))
+            print(f"  {flag} {size:>8} {name:<40} {ratio:6.2f}x")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파이프라인 벤치마크 스위트")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-plots', action='store_true', help='시각화 벤치마크 생략')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용 감속 비율 (0.25 = 25%%)')
+    parser.add_argument('--update-baseline', action='store_true', help='이번 결과로 기준값 파일 갱신')
+    parser.add_argument('--output', help='이번 결과를 저장할 JSON 경로')
+    args = parser.parse_args()
+
+    results = {str(n): bench_size(n, args.repeat, args.skip_plots) for n in args.sizes}
+    record = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, indent=2)
+
+    failures = failed_cases(results)
+    if args.update_baseline:
+        if failures:
+            print(f"\n❌ 실패한 항목이 있어 기준값을 갱신하지 않습니다: {failures}")
+            sys.exit(1)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 기준값 갱신: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("\n[경고] 기준값 파일이 없습니다. --update-baseline 으로 먼저 생성하세요.")
+        sys.exit(1 if failures else 0)
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance, skipped=PLOTS if args.skip_plots else ())
+    if regressions:
+        print(f"\n❌ 성능 회귀/실패 {len(regressions)}건")
+        sys.exit(1)
+    print("\n✅ 성능 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
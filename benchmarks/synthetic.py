@@ -0,0 +1,91 @@
+"""
+수집기(SeleniumTwitterCollector.save_posts)와 같은 스키마의 재현 가능한 합성 트윗 생성기.
+author, text, hashtags("#a,#b"), likes/retweets/replies/views(천 단위 콤마 문자열),
+created_at(ISO, 'Z'), url 컬럼을 만든다.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+WORDS = [
+    'chill', 'guy', 'meme', 'vibe', 'today', 'coin', 'market', 'dance', 'challenge', 'comeback',
+    'lol', 'real', 'mood', 'video', 'song', 'moon', 'pump', 'fan', 'edit', 'trend',
+    '밈', '챌린지', '오늘', '진짜', '너무', '귀여워', '노래', '영상', '컴백', '에스파',
+    '나니가스키', '라이즈', '댄스', '유행', '대박', '웃기다', '요즘', '친구', '같이', '보기',
+]
+HASHTAGS = ['#chillguy', '#meme', '#aespa', '#에스파', '#나니가스키', '#challenge', '#riize', '#라이즈',
+            '#memecoin', '#dirtywork', '#kpop', '#밈', '#viral', '#fyp', '#trend']
+AUTHORS = [f"user_{i:05d}" for i in range(5000)] + ['just a chill guy | fan page', 'Pop Base', '[deleted]']
+
+
+class StubEmbedder:
+    """perform_clustering 벤치마크용 임베더: 텍스트 해시를 32차원 벡터로 펼친다 (모델 로딩 없음)"""
+
+    def __init__(self, dim=32):
+        self.dim = dim
+
+    def encode(self, texts, show_progress_bar=False):
+        hashes = pd.util.hash_array(np.asarray(texts, dtype=object))
+        shifts = np.arange(self.dim, dtype=np.uint64) * np.uint64(64 // self.dim)
+        return ((hashes[:, None] >> shifts) & np.uint64(3)).astype(np.float32)
+
+
+def _format_count(values):
+    # 수집기 aria-label처럼 1,000 이상은 콤마 포함 문자열
+    return pd.Series(values).map('{:,}'.format)
+
+
+def generate_tweets(n_rows, seed=42, n_texts=None, start='2025-05-01', days=60):
+    """
+    n_rows개의 합성 트윗 DataFrame 생성 (seed가 같으면 항상 같은 결과).
+    텍스트는 n_texts개 풀에서 지프 분포로 뽑아 리트윗/복붙 밈처럼 중복이 생기게 한다.
+    """
+    rng = np.random.default_rng(seed)
+    n_texts = n_texts or max(100, n_rows // 5)
+
+    # 텍스트 풀: 단어 4~14개 + 해시태그 0~3개 + 가끔 URL
+    words = np.array(WORDS, dtype=object)
+    tags = np.array(HASHTAGS, dtype=object)
+    lengths = rng.integers(4, 15, size=n_texts)
+    n_tags = rng.choice(4, size=n_texts, p=[0.4, 0.3, 0.2, 0.1])
+    word_idx = rng.integers(0, len(words), size=lengths.sum())
+    tag_idx = rng.integers(0, len(tags), size=n_tags.sum())
+    with_url = rng.random(n_texts) < 0.2
+
+    pool, w_pos, t_pos = [], 0, 0
+    for i in range(n_texts):
+        parts = list(words[word_idx[w_pos:w_pos + lengths[i]]]) + list(tags[tag_idx[t_pos:t_pos + n_tags[i]]])
+        w_pos += lengths[i]
+        t_pos += n_tags[i]
+        if with_url[i]:
+            parts.append(f"https://t.co/{i:x}")
+        pool.append(' '.join(parts))
+    pool = np.array(pool, dtype=object)
+    pool_tags = np.array([','.join(re.findall(r'#\w+', text)) for text in pool], dtype=object)
+
+    text_idx = np.minimum(rng.zipf(1.3, size=n_rows) - 1, n_texts - 1)
+    author_idx = np.minimum(rng.zipf(1.5, size=n_rows) - 1, len(AUTHORS) - 1)
+
+    # 생애주기 형태의 시간 분포: 감마 분포로 초반 급증 후 긴 꼬리
+    offsets = np.minimum(rng.gamma(2.0, days / 8, size=n_rows), days - 1e-6)
+    created = np.datetime64(start, 's') + (offsets * 86400).astype('timedelta64[s]')
+    created_at = pd.Series(np.datetime_as_string(created, unit='s')) + '.000Z'
+
+    views = rng.lognormal(7, 2, size=n_rows).astype(np.int64)
+    likes = (views * rng.beta(1, 30, size=n_rows)).astype(np.int64)
+    retweets = (likes * rng.beta(1, 4, size=n_rows)).astype(np.int64)
+    replies = (likes * rng.beta(1, 10, size=n_rows)).astype(np.int64)
+    views[rng.random(n_rows) < 0.05] = 0  # 조회수 미표시 트윗
+
+    return pd.DataFrame({
+        'author': np.array(AUTHORS, dtype=object)[author_idx],
+        'text': pool[text_idx],
+        'hashtags': pool_tags[text_idx],
+        'likes': _format_count(likes),
+        'retweets': _format_count(retweets),
+        'replies': _format_count(replies),
+        'views': _format_count(views),
+        'created_at': created_at,
+        'url': [f"https://x.com/user/status/{1930000000000000000 + i}" for i in range(n_rows)],
+    })
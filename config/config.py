@@ -14,10 +14,12 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # 데이터 경로
 RAW_DATA_DIR = os.path.join(PROJECT_ROOT, 'data', 'raw')
 PROCESSED_DATA_DIR = os.path.join(PROJECT_ROOT, 'data', 'processed')
+STATE_DIR = os.path.join(PROCESSED_DATA_DIR, 'state')  # 누적 분석 상태
 
 # 결과물 경로
 FIGURES_DIR = os.path.join("results", "figures")
 REPORTS_DIR = os.path.join("results", "reports")
+HISTORY_DB_PATH = os.path.join(REPORTS_DIR, "metrics_history.sqlite")  # 실행별 지표 이력
 
 # 밈 목록
 TARGET_MEMES = [
@@ -32,5 +34,5 @@ START_DATE = datetime(2024, 1, 1)
 END_DATE = datetime(2024, 12, 31)
 
 # 필요한 디렉토리 자동 생성
-for path in [RAW_DATA_DIR, PROCESSED_DATA_DIR, FIGURES_DIR, REPORTS_DIR]:
+for path in [RAW_DATA_DIR, PROCESSED_DATA_DIR, STATE_DIR, FIGURES_DIR, REPORTS_DIR]:
     os.makedirs(path, exist_ok=True)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+트위터 밈 수명 주기 분석 프로젝트 - 해시태그 인덱스 조회 실행 파일
+전처리 데이터로 해시태그 인덱스를 만들어 상위 태그 또는 특정 태그의 동시출현/일별 추이를 출력
+(예: python run_hashtag_index_twitter.py --meme "chill guy" --tag chillguy)
+"""
+
+import argparse
+import os
+
+from config.config import PROCESSED_DATA_DIR, REPORTS_DIR
+from src.analyzers.selenium_twitter_hashtag_index import SeleniumTwitterHashtagIndex
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Twitter 밈 해시태그 인덱스 조회')
+    parser.add_argument('--meme', type=str, default='chill guy', help='분석할 밈 이름')
+    parser.add_argument('--tag', type=str, help='조회할 해시태그 (생략하면 상위 태그 목록)')
+    parser.add_argument('--top', type=int, default=10, help='출력할 태그 수')
+    parser.add_argument('--save-trend', action='store_true', help='태그 일별 추이를 reports에 CSV로 저장')
+    args = parser.parse_args()
+
+    slug = args.meme.replace(' ', '_').lower()
+    filepath = os.path.join(PROCESSED_DATA_DIR, f"processed_twitter_{slug}.csv")
+    if not os.path.exists(filepath):
+        print(f"⚠ 전처리된 데이터가 없습니다: {filepath}")
+        return
+
+    _, index = SeleniumTwitterHashtagIndex.from_csv(filepath)
+    if not args.tag:
+        print(f"\n#️⃣ 상위 해시태그 (트윗 수)")
+        for tag, count in index.tag_counts().head(args.top).items():
+            print(f"  {tag:<30} {count}")
+        return
+
+    result = index.describe(args.tag, args.top)
+    print(f"\n#️⃣ {result['tag']}: 트윗 {result['tweets']}개")
+    print("함께 쓰인 해시태그:")
+    for tag, count in result['cotags'].items():
+        print(f"  {tag:<30} {count}")
+    trend = result['trend']
+    if not trend.empty:
+        print(f"일별 추이: {trend.index.min().date()} ~ {trend.index.max().date()}, 최대 {trend.max()}개 ({trend.idxmax().date()})")
+        if args.save_trend:
+            path = os.path.join(REPORTS_DIR, f"{slug}_{result['tag'].lstrip('#')}_trend.csv")
+            trend.rename_axis('date').rename('posts').to_csv(path)
+            print(f"✓ 일별 추이 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,14 @@ import sys
 import time
 import glob
 import os
+import logging
 import pandas as pd
 from datetime import datetime
 
-from src.collectors.selenium_twitter_collector import SeleniumTwitterCollector
-from src.preprocessors.selenium_twitter_preprocessor import SeleniumTwitterPreprocessor
-from src.visualizers.selenium_twitter_visualizer import SeleniumTwitterVisualizer
-from src.analyzers.selenium_twitter_lifecycle_analyzer import SeleniumTwitterLifecycleAnalyzer
-from config.config import RAW_DATA_DIR, PROCESSED_DATA_DIR, FIGURES_DIR
+from src.instrumentation import RunRecorder, record_rows
+
+# 각 단계의 무거운 의존성(selenium, torch, sklearn, matplotlib 등)은 해당 단계 함수 안에서만 import
+from config.config import RAW_DATA_DIR, PROCESSED_DATA_DIR, STATE_DIR, FIGURES_DIR, REPORTS_DIR, HISTORY_DB_PATH
 
 def run_collection(meme_name):
     print(f"\n{'='*50}")
@@ -18,6 +18,8 @@ def run_collection(meme_name):
     print(f"{'='*50}")
 
     try:
+        from src.collectors.selenium_twitter_collector import SeleniumTwitterCollector
+
         collector = SeleniumTwitterCollector(save_dir=RAW_DATA_DIR)
         posts = collector.search_posts(meme_name, max_posts=1000)
 
@@ -44,13 +46,17 @@ def run_preprocessing(meme_name):
 
     latest_file = max(files, key=os.path.getctime)
     df_raw = pd.read_csv(latest_file)
+    record_rows(len(df_raw))
 
     if df_raw.empty:
         print("⚠ CSV 파일이 비어 있음. 전처리 중단.")
         return None
 
+    from src.preprocessors.selenium_twitter_preprocessor import SeleniumTwitterPreprocessor
+
     preprocessor = SeleniumTwitterPreprocessor()
     df_processed = preprocessor.preprocess(df_raw)
+    df_processed = preprocessor.estimate_last_seen(df_processed)  # 생존 분석용 last_seen_at
 
     processed_filename = f"processed_twitter_{meme_name.replace(' ', '_').lower()}.csv"
     df_processed.to_csv(os.path.join(PROCESSED_DATA_DIR, processed_filename), index=False)
@@ -63,12 +69,16 @@ def run_visualization(processed_filename, meme_name):
     print(f"3단계: 시각화 생성")
     print(f"{'='*50}")
 
-    #시각화 클래스 초기화
-    visualizer = SeleniumTwitterVisualizer(output_dir=FIGURES_DIR)
+    from src.visualizers.selenium_twitter_visualizer import SeleniumTwitterVisualizer
+    from src.preprocessors.selenium_twitter_token_counter import SeleniumTwitterTokenCounter
+
+    #시각화 클래스 초기화 (밈별 하위 폴더에 저장해 다른 밈의 그래프를 덮어쓰지 않음)
+    visualizer = SeleniumTwitterVisualizer(output_dir=os.path.join(FIGURES_DIR, meme_name.replace(' ', '_').lower()))
 
     #전처리된 파일 로드
     filepath = os.path.join(PROCESSED_DATA_DIR, processed_filename)
     df = pd.read_csv(filepath)
+    record_rows(len(df))
 
     # datetime 컬럼 정리 
     df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce')
@@ -80,40 +90,128 @@ def run_visualization(processed_filename, meme_name):
     df['day_abbr'] = df['created_at'].dt.day_name().str[:3].str.upper()
     df['like_rate'] = df['likes'] / (df['views'] + 1e-6)  # 분모 0 방지용
 
+    # 토큰/해시태그 빈도: 이전 스냅샷 누적분에 이번 스냅샷의 새 트윗만 스트리밍으로 합산
+    # (워드클라우드/상위 해시태그 그래프는 이번 스냅샷이 아닌 지금까지 수집한 트윗 전체 기준)
+    counts_path = os.path.join(PROCESSED_DATA_DIR, f"token_counts_{meme_name.replace(' ', '_').lower()}.json")
+    token_counter = SeleniumTwitterTokenCounter.load(counts_path)
+    if token_counter.update_from_csv(filepath):
+        token_counter.save(counts_path)
+
     # 시각화 함수 실행
     visualizer.plot_daily_post_trend(df)
     visualizer.plot_engagement_distribution(df)
     visualizer.plot_heatmap_by_day_hour(df)
-    visualizer.plot_wordcloud(df)
-    visualizer.plot_top_hashtags(df)
+    visualizer.plot_wordcloud(df, frequencies=token_counter.top_tokens(),
+                              title="Word Cloud (cumulative across snapshots)")
+    visualizer.plot_top_hashtags(df, hashtag_counts=token_counter.hashtags,
+                                 title="Top Hashtags (cumulative across snapshots)")
     visualizer.plot_likes_vs_views(df)
     visualizer.plot_likes_vs_retweets(df)
     visualizer.plot_likes_views_trend(df)
     visualizer.plot_retweet_trend(df)
     visualizer.plot_like_rate_distribution(df)
-    visualizer.plot_survival_curve(df)
+    survival_table = visualizer.plot_survival_curve(df)
+    if survival_table is not None:
+        survival_path = os.path.join(REPORTS_DIR, f"{meme_name}_survival.csv")
+        survival_table.to_csv(survival_path, index=False)
+        print(f"✓ 생존 분석 테이블 저장: {survival_path}")
 
     print("✓ 시각화 완료!")
 
-def run_analysis(processed_filename, meme_name):
+def run_analysis(processed_filename, meme_name, incremental=False, approximate=False, run_id=None):
     print(f"\n{'='*50}")
     print(f"4단계: 수명 주기 분석")
     print(f"{'='*50}")
 
-    df = pd.read_csv(os.path.join(PROCESSED_DATA_DIR, processed_filename))
-    df['date'] = pd.to_datetime(df['date'])
+    from src.analyzers.selenium_twitter_lifecycle_analyzer import SeleniumTwitterLifecycleAnalyzer
 
     analyzer = SeleniumTwitterLifecycleAnalyzer(save_dir=os.path.join("results", "reports"))
-    metrics, growth, decline = analyzer.analyze(df, meme_name)
+    filepath = os.path.join(PROCESSED_DATA_DIR, processed_filename)
+    if approximate:
+        # 근사 모드는 CSV 전체를 읽지 않고 청크 단위로 스케치/누적 상태에만 반영
+        metrics, growth, decline = analyzer.analyze_approximate(filepath, meme_name, STATE_DIR)
+    else:
+        df = pd.read_csv(filepath)
+        df['date'] = pd.to_datetime(df['date'])
+        record_rows(len(df))
+        if incremental:
+            metrics, growth, decline = analyzer.analyze_incremental(df, meme_name, STATE_DIR)
+        else:
+            metrics, growth, decline = analyzer.analyze(df, meme_name)
     analyzer.generate_text_report(meme_name, metrics, growth, decline)
+
+    # 실행별 지표 이력 누적 (리포트는 덮어써도 추이는 남음)
+    from src.analyzers.selenium_twitter_history import MetricsHistoryStore
+
+    MetricsHistoryStore(HISTORY_DB_PATH).append(meme_name, metrics, metadata={
+        'run_id': run_id,
+        'processed_file': processed_filename,
+        'incremental': incremental,
+        'approximate': approximate,
+    })
     print("✓ 분석 및 보고서 생성 완료")
 
+def run_history_plot(meme_name):
+    from src.analyzers.selenium_twitter_history import MetricsHistoryStore
+
+    store = MetricsHistoryStore(HISTORY_DB_PATH)
+    history = store.query(meme_name)
+    print(f"📜 '{meme_name}' 지표 이력: {len(history)}회 실행")
+    path = store.plot_trajectories(meme_name, os.path.join(FIGURES_DIR, f"{meme_name.replace(' ', '_').lower()}_metric_history.png"))
+    if path:
+        print(f"✓ 지표 추이 그래프 저장: {path}")
+
+def run_comparison():
+    print(f"\n{'='*50}")
+    print(f"밈 비교 분석 (전체 전처리 데이터)")
+    print(f"{'='*50}")
+
+    from src.analyzers.selenium_twitter_comparison import SeleniumTwitterMemeComparator, load_all_processed
+
+    df = load_all_processed(PROCESSED_DATA_DIR)
+    record_rows(len(df))
+    if df.empty:
+        print("✓ 비교할 전처리 데이터 없음")
+        return
+
+    comparator = SeleniumTwitterMemeComparator(reports_dir=REPORTS_DIR, figures_dir=FIGURES_DIR)
+    table, aligned, survival = comparator.compare(df)
+    comparator.save(table, aligned, survival)
+    print("✓ 비교 분석 완료")
+
+def run_stages(recorder, args):
+    meme_name = args.meme
+    if not args.skip_collection:
+        with recorder.stage('collection'):
+            run_collection(meme_name)
+        time.sleep(1)
+
+    with recorder.stage('preprocessing'):
+        processed = run_preprocessing(meme_name)
+    if processed:
+        if not args.skip_visualization:
+            time.sleep(1)
+            with recorder.stage('visualization'):
+                run_visualization(processed, meme_name)
+        time.sleep(1)
+        with recorder.stage('analysis'):
+            run_analysis(processed, meme_name, incremental=args.incremental, approximate=args.approximate,
+                         run_id=recorder.run_id)
+
 def main():
     parser = argparse.ArgumentParser(description="Twitter 밈 수명 주기 분석 파이프라인")
     parser.add_argument('--meme', type=str, default='chill guy', help='분석할 밈 이름')
     parser.add_argument('--skip-collection', action='store_true', help='수집 단계 생략')
+    parser.add_argument('--skip-visualization', action='store_true', help='시각화 단계 생략 (리포트만 생성)')
+    parser.add_argument('--incremental', action='store_true', help='저장된 누적 상태에 새 트윗만 합산해 분석')
+    parser.add_argument('--approximate', action='store_true', help='전처리 CSV를 청크로 스트리밍해 스냅샷 누적 스케치로 근사 분석 (분위수, 상위 작성자 포함, --incremental 대신 사용)')
+    parser.add_argument('--compare', action='store_true', help='모든 밈의 전처리 데이터를 한 번에 비교 분석')
+    parser.add_argument('--plot-history', action='store_true', help='누적된 실행별 지표 추이 그래프만 생성')
+    parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'], help='단계별 프로파일 파일 저장 (results/reports)')
+    parser.add_argument('--log-level', default='INFO', help='로그 레벨 (DEBUG면 트윗 카드별 수집 로그 출력)')
     args = parser.parse_args()
 
+    logging.basicConfig(level=args.log_level.upper(), format='%(levelname)s %(name)s: %(message)s')
     meme_name = args.meme
     print(f"\n{'='*60}")
     print(f"Twitter Meme Lifecycle 분석 시작")
@@ -121,17 +219,19 @@ def main():
     print(f"시작 시간: {datetime.now()}")
     print(f"{'='*60}")
 
+    # 비교 모드는 모든 밈 대상이므로 --meme(기본값) 대신 'comparison'으로 실행 기록 이름을 붙인다
+    run_name = 'comparison' if args.compare else meme_name
+    recorder = RunRecorder(run_name, REPORTS_DIR, profile=args.profile, metadata=vars(args))
     try:
-        if not args.skip_collection:
-            run_collection(meme_name)
-            time.sleep(1)
-
-        processed = run_preprocessing(meme_name)
-        if processed:
-            time.sleep(1)
-            run_visualization(processed, meme_name)
-            time.sleep(1)
-            run_analysis(processed, meme_name)
+        with recorder:
+            if args.compare:
+                with recorder.stage('comparison'):
+                    run_comparison()
+            elif args.plot_history:
+                with recorder.stage('history'):
+                    run_history_plot(meme_name)
+            else:
+                run_stages(recorder, args)
 
         print(f"\n{'='*60}")
         print("파이프라인 종료")
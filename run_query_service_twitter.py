@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+트위터 밈 수명 주기 분석 프로젝트 - 로컬 조회 서비스 실행 파일
+전처리 데이터와 리포트/그래프를 HTTP로 조회 (예: curl http://127.0.0.1:8765/memes/chill_guy/metrics)
+"""
+
+import argparse
+import asyncio
+
+from src.services.selenium_twitter_query_service import SeleniumTwitterQueryService
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Twitter 밈 분석 결과 조회 서비스')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='바인딩 주소')
+    parser.add_argument('--port', type=int, default=8765, help='포트')
+    parser.add_argument('--workers', type=int, default=2, help='집계용 워커 프로세스 수')
+    parser.add_argument('--cache-size', type=int, default=128, help='LRU 캐시 항목 수')
+    parser.add_argument('--hash-content', action='store_true', help='mtime 대신 파일 내용 해시로 캐시 무효화')
+    args = parser.parse_args()
+
+    service = SeleniumTwitterQueryService(workers=args.workers, cache_size=args.cache_size,
+                                          hash_content=args.hash_content)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n🔚 조회 서비스를 종료합니다.")
+
+
+if __name__ == "__main__":
+    main()
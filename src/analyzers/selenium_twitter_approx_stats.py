@@ -0,0 +1,144 @@
+import os
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.analyzers.sketches import HyperLogLog, KLLSketch, CountMinSketch
+
+QUANTILES = [0.5, 0.9, 0.99]
+QUANTILE_COLUMNS = ['engagement_score', 'views', 'like_rate']
+
+
+class ApproximateSummary:
+    """
+    대용량 코퍼스용 근사 통계. 청크 단위로 갱신되고, 스냅샷/밈 간에 병합·저장할 수 있다.
+    (스케치는 중복을 구분하지 못하므로 병합하는 요약끼리는 서로 겹치지 않는 트윗을 담고 있어야 한다)
+    - 고유 작성자 수 : HyperLogLog (상대오차 ≈ 0.8%, 4096명 이하는 정확)
+    - 분위수         : KLL (engagement/views/like_rate, 순위 오차 ≈ 1.3%)
+    - 상위 작성자/문장: Count-Min (과대추정 ≤ 0.13%·N, 확률 99.3%)
+    - 스냅샷 간 중복 제거(analyze_approximate): SeenFilter Bloom 필터 (오탐률 ≤ 0.1% → 새 트윗이 그만큼
+      누락될 수 있음, 100만 건당 ≈ 2MB)
+    """
+
+    def __init__(self):
+        self.total_posts = 0
+        self.sums = {'likes': 0.0, 'retweets': 0.0, 'views': 0.0}
+        self.first_seen = None
+        self.last_seen = None
+        self.authors = HyperLogLog()
+        self.quantile_sketches = {col: KLLSketch() for col in QUANTILE_COLUMNS}
+        self.top_authors = CountMinSketch()
+        self.top_texts = CountMinSketch()
+
+    def update(self, df):
+        # ✅ 한 청크를 스케치에 반영 (청크 크기만큼의 메모리만 사용)
+        if df.empty:
+            return self
+        self.total_posts += len(df)
+        for col in self.sums:
+            if col in df.columns:
+                self.sums[col] += float(df[col].sum())
+
+        if 'created_at' in df.columns:
+            created = pd.to_datetime(df['created_at'], errors='coerce', utc=True).dropna()
+            if not created.empty:
+                lo, hi = created.min().isoformat(), created.max().isoformat()
+                self.first_seen = lo if self.first_seen is None else min(self.first_seen, lo)
+                self.last_seen = hi if self.last_seen is None else max(self.last_seen, hi)
+
+        if 'author' in df.columns:
+            self.authors.add(df['author'])
+            self.top_authors.add(df['author'])
+        text_col = 'text_clean' if 'text_clean' in df.columns else 'text'
+        if text_col in df.columns:
+            self.top_texts.add(df[text_col].where(df[text_col] != ''))
+
+        if 'engagement_score' in df.columns:
+            self.quantile_sketches['engagement_score'].add(df['engagement_score'].to_numpy(dtype=float))
+        if 'views' in df.columns:
+            views = df['views'].to_numpy(dtype=float)
+            self.quantile_sketches['views'].add(views)
+            if 'likes' in df.columns:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    like_rate = df['likes'].to_numpy(dtype=float) / views
+                self.quantile_sketches['like_rate'].add(like_rate[views > 0])
+        return self
+
+    def update_from_csv(self, filepath, chunksize=100000):
+        # ✅ 전처리된 CSV를 청크로 읽어 갱신
+        for chunk in pd.read_csv(filepath, chunksize=chunksize):
+            self.update(chunk)
+        return self
+
+    def merge(self, other):
+        self.total_posts += other.total_posts
+        for col in self.sums:
+            self.sums[col] += other.sums[col]
+        for attr, pick in (('first_seen', min), ('last_seen', max)):
+            values = [v for v in (getattr(self, attr), getattr(other, attr)) if v is not None]
+            setattr(self, attr, pick(values) if values else None)
+        self.authors.merge(other.authors)
+        for col in QUANTILE_COLUMNS:
+            self.quantile_sketches[col].merge(other.quantile_sketches[col])
+        self.top_authors.merge(other.top_authors)
+        self.top_texts.merge(other.top_texts)
+        return self
+
+    def summary(self, top_n=5):
+        # ✅ save_processed_data 요약 / analyze_approximate 지표에 쓰는 dict
+        n = self.total_posts or 1
+        summary = {
+            'total_posts': self.total_posts,
+            'date_range': f"{self.first_seen} ~ {self.last_seen}",
+            'unique_authors': self.authors.count(),
+            'avg_likes': self.sums['likes'] / n,
+            'avg_retweets': self.sums['retweets'] / n,
+            'avg_views': self.sums['views'] / n,
+        }
+        for col, sketch in self.quantile_sketches.items():
+            for q, value in zip(QUANTILES, sketch.quantiles(QUANTILES)):
+                summary[f'{col}_p{int(q * 100)}'] = float(value)
+        summary['top_authors'] = self.top_authors.heavy_hitters(top_n)
+        summary['top_texts'] = self.top_texts.heavy_hitters(top_n)
+        return summary
+
+    # ---------- 저장/불러오기 ----------
+    def to_dict(self):
+        return {
+            'version': 1,
+            'total_posts': self.total_posts,
+            'sums': self.sums,
+            'first_seen': self.first_seen,
+            'last_seen': self.last_seen,
+            'authors': self.authors.to_dict(),
+            'quantiles': {col: sketch.to_dict() for col, sketch in self.quantile_sketches.items()},
+            'top_authors': self.top_authors.to_dict(),
+            'top_texts': self.top_texts.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        obj = cls()
+        obj.total_posts = state['total_posts']
+        obj.sums.update(state['sums'])
+        obj.first_seen = state.get('first_seen')
+        obj.last_seen = state.get('last_seen')
+        obj.authors = HyperLogLog.from_dict(state['authors'])
+        obj.quantile_sketches = {col: KLLSketch.from_dict(s) for col, s in state['quantiles'].items()}
+        obj.top_authors = CountMinSketch.from_dict(state['top_authors'])
+        obj.top_texts = CountMinSketch.from_dict(state['top_texts'])
+        return obj
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
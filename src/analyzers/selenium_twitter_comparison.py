@@ -0,0 +1,145 @@
+import os
+import glob
+
+import numpy as np
+import pandas as pd
+
+from src.analyzers.selenium_twitter_lifecycle_analyzer import SeleniumTwitterLifecycleAnalyzer, smooth_daily_counts
+from src.analyzers.selenium_twitter_survival import survival_durations, kaplan_meier, median_survival
+from src.instrumentation import timed
+
+COMPARISON_COLUMNS = ['author', 'likes', 'retweets', 'views', 'engagement_score', 'date', 'created_at', 'last_seen_at']
+
+
+def load_all_processed(processed_dir, memes=None):
+    """
+    processed_twitter_<meme>.csv 파일들을 meme 컬럼을 붙여 하나의 테이블로 합친다 (필요한 컬럼만 읽음)
+    """
+    frames = []
+    for path in sorted(glob.glob(os.path.join(processed_dir, 'processed_twitter_*.csv'))):
+        meme = os.path.basename(path)[len('processed_twitter_'):-len('.csv')]
+        if memes and meme not in {m.replace(' ', '_').lower() for m in memes}:
+            continue
+        frame = pd.read_csv(path, usecols=lambda c: c in COMPARISON_COLUMNS)
+        frame['meme'] = meme
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=COMPARISON_COLUMNS + ['meme'])
+    df = pd.concat(frames, ignore_index=True)
+    df['meme'] = df['meme'].astype('category')
+    print(f"📂 밈 {len(frames)}개 / 게시물 {len(df)}개 로드")
+    return df
+
+
+class SeleniumTwitterMemeComparator:
+    """
+    모든 밈을 하나의 테이블에서 그룹 단위 벡터 연산으로 비교한다.
+    (밈별 analyze()를 N번 돌리는 대신 groupby 한 번 + 밈 × 일 행렬 한 번)
+    """
+
+    def __init__(self, reports_dir, figures_dir, smooth_window=7):
+        self.reports_dir = reports_dir
+        self.figures_dir = figures_dir
+        self.smooth_window = smooth_window
+        os.makedirs(self.reports_dir, exist_ok=True)
+        os.makedirs(self.figures_dir, exist_ok=True)
+
+    @timed
+    def compute_metrics(self, df):
+        # ✅ analyze()의 지표를 모든 밈에 대해 한 번의 groupby로 계산
+        df = df.assign(date=pd.to_datetime(df['date'], errors='coerce')).dropna(subset=['date'])
+        views = df['views'].where(df['views'] != 0)
+        df = df.assign(like_rate=df['likes'] / views, retweet_rate=df['retweets'] / views)
+
+        table = df.groupby('meme', observed=True).agg(
+            total_posts=('date', 'size'),
+            unique_authors=('author', 'nunique'),
+            first_date=('date', 'min'),
+            last_date=('date', 'max'),
+            avg_likes=('likes', 'mean'),
+            avg_retweets=('retweets', 'mean'),
+            avg_views=('views', 'mean'),
+            total_engagement=('engagement_score', 'sum'),
+            like_rate=('like_rate', 'mean'),
+            retweet_rate=('retweet_rate', 'mean'),
+        )
+        table['duration_days'] = (table['last_date'] - table['first_date']).dt.days + 1
+
+        # 생애주기 단계: 밈 × 일 행렬 한 번으로 전체 분할
+        analyzer = SeleniumTwitterLifecycleAnalyzer(save_dir=self.reports_dir, smooth_window=self.smooth_window)
+        phases = analyzer.segment_memes(df, meme_col='meme').set_index('meme')
+        return table.join(phases)
+
+    @timed
+    def align_lifecycles(self, df):
+        # ✅ 각 밈의 첫 등장일을 0일로 맞춘 일별 게시물 수 (행: 경과일, 열: 밈)
+        dates = pd.to_datetime(df['date'], errors='coerce').dt.normalize()
+        valid = dates.notna().to_numpy()
+        dates = dates[valid]
+        codes, memes = pd.factorize(df.loc[valid, 'meme'], sort=True)
+        if len(memes) == 0:
+            return pd.DataFrame()
+
+        day = ((dates - dates.min()) // pd.Timedelta(days=1)).to_numpy()
+        first_day = np.full(len(memes), day.max())
+        np.minimum.at(first_day, codes, day)
+        offset = day - first_day[codes]
+
+        n_days = int(offset.max()) + 1
+        counts = np.bincount(offset * len(memes) + codes, minlength=n_days * len(memes))
+        aligned = pd.DataFrame(counts.reshape(n_days, len(memes)), columns=list(memes))
+        aligned.index.name = 'days_since_first'
+        return aligned
+
+    @timed
+    def survival_curves(self, df):
+        # ✅ 모든 밈의 Kaplan-Meier 곡선을 kaplan_meier 한 번(그룹 = 밈)으로 계산
+        if 'last_seen_at' not in df.columns:
+            print("[경고] last_seen_at 컬럼이 없어 생존 분석을 건너뜁니다.")
+            return None
+        durations, events, valid = survival_durations(df)
+        if len(durations) == 0:
+            return None
+        return kaplan_meier(durations, events, df.loc[valid, 'meme'].astype(str).to_numpy())
+
+    def compare(self, df):
+        print("\n🆚=== 밈 비교 분석 시작 ===")
+        table = self.compute_metrics(df)
+        aligned = self.align_lifecycles(df)
+        survival = self.survival_curves(df)
+        if survival is not None:
+            table = table.join(median_survival(survival).rename('median_survival_days'))
+        print(f"✅ 밈 {len(table)}개 비교 완료")
+        return table, aligned, survival
+
+    def save(self, table, aligned, survival=None, max_days=90):
+        table_path = os.path.join(self.reports_dir, 'meme_comparison.csv')
+        table.to_csv(table_path)
+        aligned.to_csv(os.path.join(self.reports_dir, 'meme_lifecycle_aligned.csv'))
+        if survival is not None:
+            survival.to_csv(os.path.join(self.reports_dir, 'meme_survival.csv'), index=False)
+        print(f"✅ 비교 테이블 저장: {table_path}")
+        return table_path, self.plot_aligned_lifecycles(aligned, max_days)
+
+    def plot_aligned_lifecycles(self, aligned, max_days=90):
+        # ✅ 첫 등장 기준 경과일별 게시물 비중(평활) 곡선 — 규모가 다른 밈도 모양을 비교할 수 있도록 정규화
+        import matplotlib.pyplot as plt
+
+        if aligned.empty:
+            print("[경고] 비교할 데이터가 없어 시각화를 건너뜁니다.")
+            return None
+        window = aligned.iloc[:max_days]
+        share = window.to_numpy(dtype=float) / np.maximum(aligned.to_numpy().sum(axis=0), 1)
+        smoothed = smooth_daily_counts(share.T, self.smooth_window).T
+
+        plt.figure(figsize=(10, 5))
+        for i, meme in enumerate(window.columns):
+            plt.plot(window.index, smoothed[:, i], label=meme)
+        plt.title("Meme Lifecycle Comparison (aligned to first appearance)")
+        plt.xlabel("Days Since First Appearance")
+        plt.ylabel("Share of Posts (smoothed)")
+        plt.legend()
+        path = os.path.join(self.figures_dir, "meme_lifecycle_comparison.png")
+        plt.savefig(path)
+        plt.close()
+        return path
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from src.preprocessors.selenium_twitter_token_counter import parse_hashtags
+
+
+class SeleniumTwitterHashtagIndex:
+    """
+    수집기의 hashtags 필드로부터 한 번의 순회로 만드는 해시태그 인덱스.
+    - 역색인: 태그 → 트윗 행 번호 (CSC 행렬의 열 슬라이스)
+    - 동시출현 행렬: 태그×태그 희소 행렬 (대각 = 태그별 트윗 수)
+    - 일별 시계열: 태그×날짜 희소 행렬
+    """
+
+    def __init__(self):
+        self.tags = []
+        self.tag_ids = {}
+        self.dates = pd.DatetimeIndex([])
+        self.incidence = sparse.csc_matrix((0, 0), dtype=np.int32)
+        self.cooccurrence = sparse.csr_matrix((0, 0), dtype=np.int32)
+        self.daily = sparse.csr_matrix((0, 0), dtype=np.int32)
+
+    @classmethod
+    def from_csv(cls, filepath, hashtag_col='hashtags', date_col='date'):
+        # ✅ 전처리된 CSV에서 인덱스에 필요한 컬럼(+ 트윗 조회용 author/text/url)만 읽어 생성
+        keep = {hashtag_col, date_col, 'author', 'text', 'url'}
+        df = pd.read_csv(filepath, usecols=lambda c: c in keep)
+        return df, cls().build(df, hashtag_col=hashtag_col, date_col=date_col)
+
+    def build(self, df, hashtag_col='hashtags', date_col='date'):
+        # ✅ 한 번의 순회로 (행, 태그) 좌표 수집 → 희소 행렬 구성
+        print("\n#️⃣=== 해시태그 인덱스 생성 ===")
+        rows, cols = [], []
+        tag_ids = {}
+        for row_id, value in enumerate(df[hashtag_col].tolist() if hashtag_col in df.columns else []):
+            for tag in set(parse_hashtags(value)):
+                tag_id = tag_ids.setdefault(tag, len(tag_ids))
+                rows.append(row_id)
+                cols.append(tag_id)
+
+        self.tag_ids = tag_ids
+        self.tags = list(tag_ids)
+        n_rows, n_tags = len(df), len(tag_ids)
+        data = np.ones(len(rows), dtype=np.int32)
+        incidence = sparse.coo_matrix((data, (rows, cols)), shape=(n_rows, n_tags))
+        self.incidence = incidence.tocsc()
+
+        # 동시출현: Xᵀ·X
+        csr = incidence.tocsr()
+        self.cooccurrence = (csr.T @ csr).tocsr()
+
+        # 일별 시계열: Xᵀ·D (D = 트윗×날짜 원-핫)
+        if date_col in df.columns:
+            days = pd.to_datetime(df[date_col], errors='coerce').dt.normalize()
+            codes, uniques = pd.factorize(days, sort=True)
+            valid = codes >= 0
+            day_matrix = sparse.coo_matrix(
+                (np.ones(valid.sum(), dtype=np.int32), (np.flatnonzero(valid), codes[valid])),
+                shape=(n_rows, len(uniques))
+            ).tocsr()
+            self.dates = pd.DatetimeIndex(uniques)
+            self.daily = (csr.T @ day_matrix).tocsr()
+
+        print(f"✅ 해시태그 {n_tags}개 / 트윗 {n_rows}개 인덱싱 완료")
+        return self
+
+    def _tag_id(self, tag):
+        tag = tag.lower() if tag.startswith('#') else f"#{tag.lower()}"
+        return self.tag_ids.get(tag)
+
+    def tweets_with(self, tag):
+        # ✅ 태그를 사용한 트윗의 행 번호 배열
+        tag_id = self._tag_id(tag)
+        if tag_id is None:
+            return np.array([], dtype=np.int64)
+        start, end = self.incidence.indptr[tag_id], self.incidence.indptr[tag_id + 1]
+        return np.sort(self.incidence.indices[start:end])
+
+    def tag_counts(self):
+        # ✅ 태그별 트윗 수 (동시출현 행렬의 대각)
+        return pd.Series(self.cooccurrence.diagonal(), index=self.tags).sort_values(ascending=False)
+
+    def top_cotags(self, tag, n=10):
+        # ✅ 함께 등장한 태그 상위 n개 (자기 자신 제외)
+        tag_id = self._tag_id(tag)
+        if tag_id is None:
+            return pd.Series(dtype=np.int64)
+        row = self.cooccurrence.getrow(tag_id)
+        pairs = [(self.tags[j], c) for j, c in zip(row.indices, row.data) if j != tag_id]
+        pairs.sort(key=lambda x: -x[1])
+        return pd.Series(dict(pairs[:n]), dtype=np.int64)
+
+    def tag_trend(self, tag, fill_missing_days=True):
+        # ✅ 태그의 일별 트윗 수 시계열
+        tag_id = self._tag_id(tag)
+        if tag_id is None or len(self.dates) == 0:
+            return pd.Series(dtype=np.int64)
+        series = pd.Series(self.daily.getrow(tag_id).toarray().ravel(), index=self.dates)
+        if fill_missing_days:
+            series = series.reindex(pd.date_range(self.dates.min(), self.dates.max(), freq='D'), fill_value=0)
+        return series
+
+    def describe(self, tag, n=10):
+        # ✅ 태그 하나의 조회 결과 묶음: 트윗 수, 함께 쓰인 태그 상위 n개, 일별 추이
+        return {
+            'tag': tag.lower() if tag.startswith('#') else f"#{tag.lower()}",
+            'tweets': len(self.tweets_with(tag)),
+            'cotags': self.top_cotags(tag, n),
+            'trend': self.tag_trend(tag),
+        }
@@ -0,0 +1,123 @@
+import os
+import json
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+
+from src.analyzers.selenium_twitter_lifecycle_analyzer import LIFECYCLE_PHASES
+
+METRIC_COLUMNS = [
+    ('total_posts', 'INTEGER'),
+    ('unique_authors', 'INTEGER'),
+    ('duration_days', 'INTEGER'),
+    ('avg_likes', 'REAL'),
+    ('avg_retweets', 'REAL'),
+    ('avg_views', 'REAL'),
+    ('total_engagement', 'REAL'),
+    ('like_rate', 'REAL'),
+    ('retweet_rate', 'REAL'),
+    ('date_range', 'TEXT'),
+    ('peak_date', 'TEXT'),
+]
+PHASE_COLUMNS = [f'{phase}_{edge}' for phase in LIFECYCLE_PHASES for edge in ('start', 'end')]
+
+
+class MetricsHistoryStore:
+    """
+    분석 실행마다 지표·단계 경계·실행 메타데이터를 (meme, run_at) 키로 누적하는 SQLite 이력 테이블.
+    리포트 파일은 매번 덮어쓰지만 이력은 남으므로, 과거 스냅샷을 재처리하지 않고 추이를 조회할 수 있다.
+    run_at은 마이크로초 단위이고 기존 행을 덮어쓰지 않는다 (키가 겹치면 sqlite3.IntegrityError).
+    실행 기록(RunRecorder)과 연결하려면 metadata에 run_id를 넣는다.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        columns = ', '.join(f'{name} {sql_type}' for name, sql_type in METRIC_COLUMNS)
+        phases = ', '.join(f'{name} TEXT' for name in PHASE_COLUMNS)
+        with self._connect() as conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS metrics_history (
+                    meme TEXT NOT NULL,
+                    run_at TEXT NOT NULL,
+                    {columns},
+                    {phases},
+                    extra TEXT,
+                    metadata TEXT,
+                    PRIMARY KEY (meme, run_at)
+                )
+            """)
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path)
+
+    def append(self, meme_name, metrics, run_at=None, metadata=None):
+        # ✅ 실행 1회의 지표를 한 행으로 추가
+        if not metrics:
+            return None
+        run_at = run_at or datetime.now().isoformat(timespec='microseconds')
+        row = {'meme': meme_name, 'run_at': run_at}
+        for name, _ in METRIC_COLUMNS:
+            value = metrics.get(name)
+            row[name] = None if value is None or pd.isna(value) else (str(value) if name in ('date_range', 'peak_date') else value)
+
+        phases = metrics.get('lifecycle_phases') or {}
+        for phase in LIFECYCLE_PHASES:
+            span = phases.get(phase)
+            row[f'{phase}_start'] = str(span['start_date']) if span else None
+            row[f'{phase}_end'] = str(span['end_date']) if span else None
+
+        known = {name for name, _ in METRIC_COLUMNS} | {'lifecycle_phases'}
+        row['extra'] = json.dumps({k: v for k, v in metrics.items() if k not in known}, ensure_ascii=False, default=str)
+        row['metadata'] = json.dumps(metadata or {}, ensure_ascii=False, default=str)
+
+        placeholders = ', '.join('?' for _ in row)
+        with self._connect() as conn:
+            conn.execute(f"INSERT INTO metrics_history ({', '.join(row)}) VALUES ({placeholders})",
+                         [float(v) if hasattr(v, 'item') else v for v in row.values()])
+        print(f"🗃️ 지표 이력 저장: {meme_name} @ {run_at}")
+        return run_at
+
+    def query(self, meme_name=None, columns=None, since=None, until=None):
+        """
+        이력 조회 → run_at 순 DataFrame
+        columns로 필요한 지표만 고를 수 있다 (meme, run_at은 항상 포함).
+        """
+        selected = ['meme', 'run_at'] + list(columns) if columns else ['*']
+        clauses, params = [], []
+        if meme_name:
+            clauses.append('meme = ?')
+            params.append(meme_name)
+        if since:
+            clauses.append('run_at >= ?')
+            params.append(str(since))
+        if until:
+            clauses.append('run_at <= ?')
+            params.append(str(until))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        with self._connect() as conn:
+            df = pd.read_sql_query(f"SELECT {', '.join(selected)} FROM metrics_history {where} ORDER BY meme, run_at",
+                                   conn, params=params)
+        df['run_at'] = pd.to_datetime(df['run_at'], format='ISO8601')
+        return df
+
+    def plot_trajectories(self, meme_name, output_path, columns=('total_posts', 'unique_authors', 'avg_likes', 'like_rate')):
+        # ✅ 실행별 지표 변화 추이 (지표마다 subplot)
+        import matplotlib.pyplot as plt
+
+        history = self.query(meme_name, columns=columns)
+        if history.empty:
+            print(f"[경고] '{meme_name}'의 지표 이력이 없어 시각화를 건너뜁니다.")
+            return None
+
+        fig, axes = plt.subplots(len(columns), 1, figsize=(10, 2.5 * len(columns)), sharex=True)
+        for ax, column in zip(axes if len(columns) > 1 else [axes], columns):
+            ax.plot(history['run_at'], history[column], marker='o')
+            ax.set_ylabel(column)
+        fig.suptitle(f"Metric History Across Runs - {meme_name}")
+        plt.xlabel("Run Time")
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        plt.savefig(output_path)
+        plt.close(fig)
+        return output_path
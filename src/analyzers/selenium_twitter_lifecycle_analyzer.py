@@ -1,12 +1,126 @@
 import os
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+from src.analyzers.selenium_twitter_online_analyzer import OnlineLifecycleState
+from src.analyzers.selenium_twitter_approx_stats import ApproximateSummary
+from src.instrumentation import timed, record_rows
+
+LIFECYCLE_PHASES = ['emergence', 'growth', 'peak', 'decline', 'dormancy']
+
+
+def build_daily_matrix(df, meme_col='meme', date_col='date'):
+    """
+    (밈, 날짜) 행 → 밈 × 일 게시물 수 행렬. 날짜 축은 전체 기간을 빈 날 없이 채운다.
+    반환: (counts[M, D], memes, dates)
+    """
+    days = pd.to_datetime(df[date_col], errors='coerce').dt.normalize()
+    valid = days.notna().to_numpy()
+    days = days[valid]
+    if meme_col in df.columns:
+        meme_codes, memes = pd.factorize(df.loc[valid, meme_col], sort=True)
+    else:
+        meme_codes, memes = np.zeros(valid.sum(), dtype=np.int64), pd.Index(['meme'])
+    if days.empty:
+        return np.zeros((len(memes), 0)), list(memes), pd.DatetimeIndex([])
+
+    dates = pd.date_range(days.min(), days.max(), freq='D')
+    day_codes = ((days - dates[0]) // pd.Timedelta(days=1)).to_numpy()
+    flat = np.bincount(meme_codes * len(dates) + day_codes, minlength=len(memes) * len(dates))
+    return flat.reshape(len(memes), len(dates)).astype(float), list(memes), dates
+
+
+def smooth_daily_counts(counts, window=7):
+    # ✅ 누적합 기반 중심 이동평균 — 모든 밈을 한 번에 계산
+    # 가장자리도 관측 밖을 0으로 보고 같은 폭으로 나눈다 (짧은 가장자리 구간이 실제 최고점보다 커지지 않도록)
+    counts = np.atleast_2d(np.asarray(counts, dtype=float))
+    n_days = counts.shape[1]
+    half = window // 2
+    csum = np.concatenate([np.zeros((counts.shape[0], 1)), np.cumsum(counts, axis=1)], axis=1)
+    idx = np.arange(n_days)
+    lo = np.clip(idx - half, 0, n_days)
+    hi = np.clip(idx + half + 1, 0, n_days)
+    return (csum[:, hi] - csum[:, lo]) / (2 * half + 1)
+
+
+def segment_lifecycles(counts, window=7, growth_threshold=0.2, peak_threshold=0.8):
+    """
+    밈 × 일 행렬을 벡터 연산으로 생애주기 단계로 분할한다.
+    평활화한 곡선의 최고점 대비 수준이 바뀌는 지점을 단계 경계로 본다.
+      - emergence : 첫 게시일 ~ 평활값이 growth_threshold·peak에 처음 도달하기 전
+      - growth    : 그 시점 ~ 최고점 구간 직전
+      - peak      : 평활 최고일을 포함하고 평활값 ≥ peak_threshold·peak 인 연속 구간
+                    (peak_day는 이 구간 안에서 실제 게시물 수가 가장 많은 날)
+      - decline   : 최고점 구간 이후 ~ 평활값이 마지막으로 growth_threshold·peak 이상인 날
+      - dormancy  : 그 이후 ~ 관측 종료
+    반환값은 밈별 경계 인덱스 배열 dict (활동이 없는 밈은 -1).
+    """
+    counts = np.atleast_2d(np.asarray(counts, dtype=float))
+    n_memes, n_days = counts.shape
+    keys = ('first_active', 'growth_start', 'peak_start', 'peak_day', 'peak_end', 'dormancy_start')
+    if n_days == 0:
+        result = {key: np.full(n_memes, -1) for key in keys}
+        result['active'] = np.zeros(n_memes, dtype=bool)
+        result['n_days'] = 0
+        return result
+
+    idx = np.arange(n_days)
+    smoothed = smooth_daily_counts(counts, window)
+
+    active = counts.sum(axis=1) > 0
+    first_active = (counts > 0).argmax(axis=1)
+    last_active = n_days - 1 - (counts[:, ::-1] > 0).argmax(axis=1)
+
+    # 평활화가 첫/마지막 게시일 밖으로 번진 값은 무시 → 최고점·경계가 항상 활동 구간 안에 놓이도록
+    in_span = (idx >= first_active[:, None]) & (idx <= last_active[:, None])
+    smoothed = np.where(in_span, smoothed, 0.0)
+    smoothed_peak = smoothed.argmax(axis=1)
+    peak_value = smoothed.max(axis=1, initial=0)[:, None]
+
+    above_low = smoothed >= growth_threshold * peak_value
+    growth_start = np.maximum(above_low.argmax(axis=1), first_active)
+    dormancy_start = n_days - above_low[:, ::-1].argmax(axis=1)
+
+    below_peak = smoothed < peak_threshold * peak_value
+    left = np.where(below_peak & (idx <= smoothed_peak[:, None]), idx, -1).max(axis=1, initial=-1) + 1
+    right = np.where(below_peak & (idx >= smoothed_peak[:, None]), idx, n_days).min(axis=1, initial=n_days) - 1
+    peak_start = np.maximum(left, growth_start)
+
+    # 최고일: 최고점 구간 안에서 원 게시물 수가 가장 많은 날 (평활값은 하루 단위 위치가 흐려짐)
+    in_peak = (idx >= peak_start[:, None]) & (idx <= right[:, None])
+    peak_day = np.where(in_peak, counts, -1.0).argmax(axis=1)
+
+    values = (first_active, growth_start, peak_start, peak_day, right, dormancy_start)
+    result = {key: np.where(active, value, -1) for key, value in zip(keys, values)}
+    result['active'] = active
+    result['n_days'] = n_days
+    return result
+
+
+def phase_boundaries(segments, row=0):
+    # ✅ segment_lifecycles 결과의 한 행 → 단계별 (시작, 끝) 인덱스 (빈 단계는 None)
+    if not segments['active'][row]:
+        return {phase: None for phase in LIFECYCLE_PHASES}
+    s = {key: int(segments[key][row]) for key in
+         ('first_active', 'growth_start', 'peak_start', 'peak_end', 'dormancy_start')}
+    spans = {
+        'emergence': (s['first_active'], s['growth_start'] - 1),
+        'growth': (s['growth_start'], s['peak_start'] - 1),
+        'peak': (s['peak_start'], s['peak_end']),
+        'decline': (s['peak_end'] + 1, s['dormancy_start'] - 1),
+        'dormancy': (s['dormancy_start'], segments['n_days'] - 1),
+    }
+    return {phase: (start, end) if start <= end else None for phase, (start, end) in spans.items()}
+
+
 class SeleniumTwitterLifecycleAnalyzer:
-    def __init__(self, save_dir):
+    def __init__(self, save_dir, smooth_window=7):
         self.save_dir = save_dir
+        self.smooth_window = smooth_window
         os.makedirs(self.save_dir, exist_ok=True)
 
+    @timed
     def analyze(self, df, meme_name):
         """
         밈 수명 주기 분석: 총량 통계, 성장기/쇠퇴기 탐지 + 비율 기반 지표 추가
@@ -41,31 +155,129 @@ class SeleniumTwitterLifecycleAnalyzer:
             'retweet_rate': df['retweet_rate'].mean(skipna=True)
         }
 
-        # 성장기: 일별 트윗 수 최댓값이 있는 날
-        daily_counts = df.groupby('date').size()
-        if daily_counts.empty:
-            growth_phase = {'start_date': None, 'end_date': None, 'duration_days': 0}
-        else:
-            growth_peak_date = daily_counts.idxmax()
-            growth_phase = {
-                'start_date': growth_peak_date.date(),
-                'end_date': growth_peak_date.date(),
-                'duration_days': 1
-            }
+        # 생애주기 단계 분할 (평활화된 일별 곡선 기반)
+        counts, _, dates = build_daily_matrix(df, meme_col=None)
+        segments = segment_lifecycles(counts, window=self.smooth_window)
+        phases = self._phases_to_dates(phase_boundaries(segments), dates)
+        metrics['peak_date'] = dates[segments['peak_day'][0]].date() if segments['active'][0] else None
+        metrics['lifecycle_phases'] = phases
 
-        # 쇠퇴기: 마지막 날짜
-        decline_date = df['date'].max()
-        decline_phase = {
-            'start_date': decline_date.date(),
-            'end_date': decline_date.date(),
-            'duration_days': 1
-        }
+        growth_phase = phases['growth'] or self._empty_phase()
+        decline_phase = phases['decline'] or self._empty_phase()
 
-        print(f"📈 성장기: {growth_phase['start_date']}")
-        print(f"📉 쇠퇴기: {decline_phase['start_date']}")
+        print(f"📈 성장기: {growth_phase['start_date']} ~ {growth_phase['end_date']}")
+        print(f"⛰️ 최고점: {metrics['peak_date']}")
+        print(f"📉 쇠퇴기: {decline_phase['start_date']} ~ {decline_phase['end_date']}")
 
         return metrics, growth_phase, decline_phase
 
+    @timed
+    def analyze_incremental(self, df, meme_name, state_dir):
+        """
+        저장된 누적 상태에 새 배치만 합산해 analyze()와 같은 결과를 반환 (전체 이력 재계산 없음)
+        """
+        print("\n📊 === 밈 누적 분석 시작 ===")
+        state_path = os.path.join(state_dir, f"{meme_name.replace(' ', '_').lower()}_lifecycle_state.json")
+        state = OnlineLifecycleState.load(state_path, meme_name)
+        added = state.update(df)
+        state.save(state_path)
+        print(f"➕ 새로 합산한 게시물: {added}개 (누적 {state.total_posts}개)")
+        return self._state_results(state)
+
+    @timed
+    def analyze_approximate(self, filepath, meme_name, state_dir, chunksize=100000):
+        """
+        전처리된 CSV를 chunksize 행씩 스트리밍해 누적 상태와 스케치에만 반영 (전체 파일을 메모리에 올리지 않음).
+        이번 스냅샷의 새 트윗으로 만든 스케치를 저장된 스냅샷 누적 스케치(_sketch.json)에 병합하고,
+        고유 작성자 수·분위수·상위 작성자는 스케치로, 나머지 지표는 analyze_incremental과 같은 누적 상태로 계산한다.
+        이미 합산한 트윗은 크기가 고정된 URL Bloom 필터로 거르므로 메모리·상태 파일 크기도 코퍼스 크기와 무관하다
+        (오탐률 ≤ dedupe_error_rate 만큼 새 트윗이 누락될 수 있음).
+        """
+        print("\n📊 === 밈 근사 분석 시작 (스트리밍) ===")
+        slug = meme_name.replace(' ', '_').lower()
+        state_path = os.path.join(state_dir, f"{slug}_approx_lifecycle_state.json")
+        sketch_path = os.path.join(state_dir, f"{slug}_sketch.json")
+        state = OnlineLifecycleState.load(state_path, meme_name)
+
+        snapshot, rows = ApproximateSummary(), 0
+        for chunk in pd.read_csv(filepath, chunksize=chunksize):
+            rows += len(chunk)
+            chunk = state.unseen(chunk)
+            state.update(chunk, skip_seen=False)
+            snapshot.update(chunk)
+
+        sketch = ApproximateSummary.load(sketch_path).merge(snapshot)
+        state.save(state_path)
+        sketch.save(sketch_path)
+        record_rows(rows)
+        print(f"➕ 새로 합산한 게시물: {snapshot.total_posts}개 / 읽은 행 {rows}개 (누적 {state.total_posts}개)")
+
+        metrics, growth_phase, decline_phase = self._state_results(state)
+        if metrics:
+            approx = sketch.summary()
+            metrics['unique_authors'] = approx['unique_authors']
+            metrics.update({k: v for k, v in approx.items() if k.endswith(('_p50', '_p90', '_p99'))})
+            metrics['top_authors'] = approx['top_authors']
+            metrics['dedupe_error_rate'] = state.seen.error_rate
+        return metrics, growth_phase, decline_phase
+
+    def _state_results(self, state):
+        # ✅ 누적 상태 → analyze()와 같은 (지표, 성장기, 쇠퇴기)
+        metrics = state.metrics()
+        if not metrics:
+            print("[경고] 누적된 데이터가 없어 분석을 수행할 수 없습니다.")
+            return {}, {}, {}
+
+        daily = state.daily_counts()
+        segments = segment_lifecycles(daily.to_numpy(), window=self.smooth_window)
+        phases = self._phases_to_dates(phase_boundaries(segments), daily.index)
+        metrics['peak_date'] = daily.index[segments['peak_day'][0]].date() if segments['active'][0] else None
+        metrics['lifecycle_phases'] = phases
+
+        growth_phase = phases['growth'] or self._empty_phase()
+        decline_phase = phases['decline'] or self._empty_phase()
+        print(f"📈 성장기: {growth_phase['start_date']} ~ {growth_phase['end_date']}")
+        print(f"📉 쇠퇴기: {decline_phase['start_date']} ~ {decline_phase['end_date']}")
+        return metrics, growth_phase, decline_phase
+
+    def segment_memes(self, df, meme_col='meme', date_col='date'):
+        """
+        여러 밈을 한 번의 호출로 단계 분할 → 밈별 최고점 날짜(analyze()의 peak_date와 같은 기준)와 단계 경계 DataFrame
+        """
+        counts, memes, dates = build_daily_matrix(df, meme_col=meme_col, date_col=date_col)
+        segments = segment_lifecycles(counts, window=self.smooth_window)
+        rows = []
+        for i, meme in enumerate(memes):
+            phases = self._phases_to_dates(phase_boundaries(segments, i), dates)
+            row = {'meme': meme, 'peak_date': dates[segments['peak_day'][i]].date() if segments['active'][i] else None}
+            for phase, span in phases.items():
+                row[f'{phase}_start'] = span['start_date'] if span else None
+                row[f'{phase}_end'] = span['end_date'] if span else None
+            rows.append(row)
+        columns = ['meme', 'peak_date'] + [f'{phase}_{edge}' for phase in LIFECYCLE_PHASES for edge in ('start', 'end')]
+        return pd.DataFrame(rows, columns=columns)
+
+    @staticmethod
+    def _empty_phase():
+        return {'start_date': None, 'end_date': None, 'duration_days': 0}
+
+    @staticmethod
+    def _phases_to_dates(bounds, dates):
+        # ✅ 인덱스 경계 → 날짜 경계
+        phases = {}
+        for phase, span in bounds.items():
+            if span is None:
+                phases[phase] = None
+                continue
+            start, end = span
+            phases[phase] = {
+                'start_date': dates[start].date(),
+                'end_date': dates[end].date(),
+                'duration_days': end - start + 1
+            }
+        return phases
+
+    @timed
     def generate_text_report(self, meme_name, metrics, growth_phase=None, decline_phase=None):
         """
         분석 결과를 텍스트 리포트 파일로 저장
@@ -101,15 +313,32 @@ class SeleniumTwitterLifecycleAnalyzer:
                 # 3. 수명 주기
                 f.write("\n3. LIFECYCLE PHASES\n")
                 f.write("-" * 30 + "\n")
-                if growth_phase and growth_phase.get("start_date"):
-                    f.write(f"Growth Phase       : {growth_phase['start_date']} ~ {growth_phase['end_date']} ({growth_phase['duration_days']} days)\n")
-                else:
-                    f.write("Growth Phase       : N/A\n")
-
-                if decline_phase and decline_phase.get("start_date"):
-                    f.write(f"Decline Phase      : {decline_phase['start_date']} ~ {decline_phase['end_date']} ({decline_phase['duration_days']} days)\n")
-                else:
-                    f.write("Decline Phase      : N/A\n")
+                phases = metrics.get('lifecycle_phases')
+                if phases is None:
+                    phases = {'growth': growth_phase, 'decline': decline_phase}
+                for phase in LIFECYCLE_PHASES:
+                    if phase not in phases:
+                        continue
+                    span = phases[phase]
+                    label = f"{phase.capitalize()} Phase"
+                    if span and span.get("start_date"):
+                        f.write(f"{label:<19}: {span['start_date']} ~ {span['end_date']} ({span['duration_days']} days)\n")
+                    else:
+                        f.write(f"{label:<19}: N/A\n")
+                if metrics.get('peak_date'):
+                    f.write(f"Peak Day           : {metrics['peak_date']}\n")
+
+                # 4. 근사 분포 통계 (approximate 모드)
+                quantile_keys = [k for k in metrics if k.endswith(('_p50', '_p90', '_p99'))]
+                if quantile_keys:
+                    f.write("\n4. DISTRIBUTION (APPROXIMATE)\n")
+                    f.write("-" * 30 + "\n")
+                    for key in quantile_keys:
+                        f.write(f"{key:<19}: {metrics[key]:.4f}\n")
+                    if 'dedupe_error_rate' in metrics:
+                        f.write(f"Dedupe FP Rate     : <= {metrics['dedupe_error_rate']:.2%}\n")
+                    for author, count in metrics.get('top_authors', []):
+                        f.write(f"Top Author         : {author} (~{count})\n")
 
             print(f"✅ 분석 리포트 저장 완료: {report_path}")
             return report_path
@@ -0,0 +1,151 @@
+import os
+import json
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from src.analyzers.sketches import HyperLogLog
+from src.dedupe import SeenFilter
+
+SUM_COLUMNS = ['likes', 'retweets', 'views', 'engagement_score']
+
+
+class OnlineLifecycleState:
+    """
+    밈 하나의 누적 분석 상태.
+    합계/개수, 작성자 HyperLogLog, 일별 게시물 수와 이미 합산한 트윗의 URL 필터(SeenFilter)만 보관하므로
+    새 배치는 배치 크기에 비례하는 비용으로 합산·저장되고, 결과는 지금까지의 스냅샷을 URL로 중복 제거한
+    합집합에 대한 일괄 계산(analyze)과 같다 (같은 트윗은 처음 본 스냅샷의 값으로 한 번만 합산).
+    수집 결과는 시간순이 아니므로(f=top) created_at 기준 watermark 대신 트윗 식별자로 중복을 거른다.
+    (작성자 수는 4096명까지 정확, 그 이상은 HyperLogLog 근사 / URL 필터 오탐률 0.1% 이하만큼 새 트윗 누락 가능)
+    """
+
+    def __init__(self, meme_name):
+        self.meme_name = meme_name
+        self.total_posts = 0
+        self.sums = {col: 0.0 for col in SUM_COLUMNS}
+        self.rate_sums = {'like_rate': 0.0, 'retweet_rate': 0.0}
+        self.rate_counts = {'like_rate': 0, 'retweet_rate': 0}
+        self.authors = HyperLogLog()
+        self.daily = Counter()
+        self.seen = SeenFilter()  # 합산한 트윗 URL
+
+    def unseen(self, df, key_col='url'):
+        # ✅ 아직 합산하지 않은 트윗만 남기고 식별자를 기록 (url 컬럼이 없으면 그대로 반환)
+        return self.seen.filter(df, key_col)
+
+    def update(self, df, skip_seen=True, key_col='url'):
+        # ✅ 새 배치를 상태에 합산 (skip_seen이면 아직 합산하지 않은 트윗만)
+        if skip_seen:
+            df = self.unseen(df, key_col)
+        df = df.copy()
+
+        df['date'] = pd.to_datetime(df['date'], errors='coerce')
+        df = df.dropna(subset=['date'])
+        if df.empty:
+            return 0
+
+        self.total_posts += len(df)
+        for col in SUM_COLUMNS:
+            if col in df.columns:
+                self.sums[col] += float(df[col].sum())
+
+        views = df['views'].where(df['views'] != 0)
+        for rate, col in (('like_rate', 'likes'), ('retweet_rate', 'retweets')):
+            values = (df[col] / views).dropna()
+            self.rate_sums[rate] += float(values.sum())
+            self.rate_counts[rate] += len(values)
+
+        self.authors.add(df['author'])
+        days = df['date'].dt.strftime('%Y-%m-%d').value_counts()
+        self.daily.update(dict(zip(days.index, days.to_numpy().tolist())))
+        return len(df)
+
+    def merge(self, other):
+        # ✅ 다른 상태(다른 수집기/프로세스)를 병합 (서로 겹치지 않는 트윗을 합산한 상태끼리만 정확)
+        self.total_posts += other.total_posts
+        for col in SUM_COLUMNS:
+            self.sums[col] += other.sums[col]
+        for rate in self.rate_sums:
+            self.rate_sums[rate] += other.rate_sums[rate]
+            self.rate_counts[rate] += other.rate_counts[rate]
+        self.authors.merge(other.authors)
+        self.daily.update(other.daily)
+        self.seen.merge(other.seen)
+        return self
+
+    def daily_counts(self):
+        # ✅ 일별 게시물 수 (빈 날은 0으로 채움)
+        if not self.daily:
+            return pd.Series(dtype=np.int64)
+        series = pd.Series(self.daily).sort_index()
+        series.index = pd.to_datetime(series.index)
+        return series.reindex(pd.date_range(series.index.min(), series.index.max(), freq='D'), fill_value=0)
+
+    def metrics(self):
+        # ✅ analyze()와 같은 키의 지표 dict
+        if not self.total_posts:
+            return {}
+        n = self.total_posts
+        days = sorted(self.daily)
+        first, last = pd.Timestamp(days[0]), pd.Timestamp(days[-1])
+        return {
+            'total_posts': n,
+            'unique_authors': self.authors.count(),
+            'date_range': f"{first.date()} ~ {last.date()}",
+            'duration_days': (last - first).days + 1,
+            'avg_likes': self.sums['likes'] / n,
+            'avg_retweets': self.sums['retweets'] / n,
+            'avg_views': self.sums['views'] / n,
+            'total_engagement': self.sums['engagement_score'],
+            'like_rate': self.rate_sums['like_rate'] / self.rate_counts['like_rate'] if self.rate_counts['like_rate'] else np.nan,
+            'retweet_rate': self.rate_sums['retweet_rate'] / self.rate_counts['retweet_rate'] if self.rate_counts['retweet_rate'] else np.nan,
+        }
+
+    # ---------- 저장/불러오기 ----------
+    def to_dict(self):
+        return {
+            'version': 2,
+            'meme_name': self.meme_name,
+            'total_posts': self.total_posts,
+            'sums': self.sums,
+            'rate_sums': self.rate_sums,
+            'rate_counts': self.rate_counts,
+            'authors': self.authors.to_dict(),
+            'daily': dict(self.daily),
+            'seen': self.seen.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state, seen_path):
+        obj = cls(state['meme_name'])
+        obj.total_posts = state['total_posts']
+        obj.sums.update(state['sums'])
+        obj.rate_sums.update(state['rate_sums'])
+        obj.rate_counts.update(state['rate_counts'])
+        obj.authors = HyperLogLog.from_dict(state['authors'])
+        obj.daily = Counter(state['daily'])
+        obj.seen = SeenFilter.from_dict(state['seen'], seen_path)
+        return obj
+
+    @staticmethod
+    def _seen_path(path):
+        # URL 필터 비트 배열은 상태 JSON 옆의 <이름>_seen_<층>.npy 파일 (저장 시 바뀐 페이지만 기록)
+        return os.path.splitext(path)[0] + '_seen'
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.seen.persist(self._seen_path(path))
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)  # 중간에 중단돼도 이전 합계/스케치 상태가 깨지지 않도록
+        return path
+
+    @classmethod
+    def load(cls, path, meme_name):
+        if not os.path.exists(path):
+            return cls(meme_name)
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f), cls._seen_path(path))
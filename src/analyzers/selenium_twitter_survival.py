@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+
+def survival_durations(df, collection_time=None, censor_window_days=1):
+    """
+    트윗별 생존 기간(일)과 사건 발생 여부 계산.
+    수집 시점 기준 censor_window_days 이내에 마지막으로 등장한 텍스트는 아직 살아있는 것으로 보고
+    우측 절단(event=0) 처리한다.
+    """
+    created = pd.to_datetime(df['created_at'], errors='coerce', utc=True)
+    last_seen = pd.to_datetime(df['last_seen_at'], errors='coerce', utc=True)
+    valid = created.notna() & last_seen.notna()
+
+    if collection_time is None:
+        collection_time = max(created[valid].max(), last_seen[valid].max()) if valid.any() else pd.Timestamp.now(tz='UTC')
+    collection_time = pd.Timestamp(collection_time)
+    if collection_time.tzinfo is None:
+        collection_time = collection_time.tz_localize('UTC')
+
+    durations = (last_seen - created) / pd.Timedelta(days=1)
+    events = (last_seen < collection_time - pd.Timedelta(days=censor_window_days)).astype(np.int8)
+    valid &= durations >= 0
+    return durations[valid].to_numpy(dtype=float), events[valid].to_numpy(), valid.to_numpy()
+
+
+def kaplan_meier(durations, events=None, groups=None):
+    """
+    여러 그룹의 Kaplan-Meier 생존 곡선을 한 번의 정렬 + 누적합으로 계산 (lifelines 불필요).
+    그룹 값이 결측(NaN/None)인 행은 제외한다 (pandas groupby 기본 동작과 동일).
+    반환: group, time, at_risk, events, censored, survival 컬럼의 DataFrame
+    """
+    durations = np.asarray(durations, dtype=float)
+    events = np.ones(len(durations), dtype=np.int64) if events is None else np.asarray(events, dtype=np.int64)
+    if groups is None:
+        codes, labels = np.zeros(len(durations), dtype=np.int64), pd.Index(['all'])
+    else:
+        codes, labels = pd.factorize(pd.Series(groups), sort=True)
+        keep = codes >= 0
+        if not keep.all():
+            durations, events, codes = durations[keep], events[keep], codes[keep]
+    if len(durations) == 0:
+        return pd.DataFrame(columns=['group', 'time', 'at_risk', 'events', 'censored', 'survival'])
+
+    # (그룹, 시간) 순 정렬 후 고유 (그룹, 시간) 경계마다 사건/절단 수 집계
+    order = np.argsort(durations)
+    if groups is not None:
+        order = order[np.argsort(codes[order], kind='stable')]  # 정수 안정 정렬(radix)로 그룹 순 재배치
+    t, g, e = durations[order], codes[order], events[order]
+    starts = np.flatnonzero(np.r_[True, (g[1:] != g[:-1]) | (t[1:] != t[:-1])])
+    counts = np.diff(np.r_[starts, len(t)])
+    n_events = np.add.reduceat(e, starts)
+    pair_group, pair_time = g[starts], t[starts]
+
+    # 그룹 내 위험집합 크기 = 그룹 크기 - 앞선 시점까지 빠져나간 수
+    group_sizes = np.bincount(g, minlength=len(labels))
+    cum = np.cumsum(counts)
+    group_first = np.flatnonzero(np.r_[True, pair_group[1:] != pair_group[:-1]])
+    offset = np.repeat(cum[group_first] - counts[group_first], np.diff(np.r_[group_first, len(starts)]))
+    at_risk = group_sizes[pair_group] - (cum - offset - counts)
+
+    # S(t) = Π(1 - d/n): 로그 누적합을 그룹마다 리셋, d == n 이후는 0
+    factor = 1.0 - n_events / at_risk
+    zero = factor <= 0
+    log_f = np.log(np.where(zero, 1.0, factor))
+    cum_log = np.cumsum(log_f)
+    cum_zero = np.cumsum(zero)
+    base_log = np.repeat(cum_log[group_first] - log_f[group_first], np.diff(np.r_[group_first, len(starts)]))
+    base_zero = np.repeat(cum_zero[group_first] - zero[group_first], np.diff(np.r_[group_first, len(starts)]))
+    survival = np.exp(cum_log - base_log) * ((cum_zero - base_zero) == 0)
+
+    return pd.DataFrame({
+        'group': np.asarray(labels)[pair_group],
+        'time': pair_time,
+        'at_risk': at_risk,
+        'events': n_events,
+        'censored': counts - n_events,
+        'survival': survival,
+    })
+
+
+def median_survival(table):
+    # ✅ 그룹별 생존확률이 처음으로 0.5 이하가 되는 시점 (도달하지 않으면 inf)
+    groups = pd.unique(table['group'])
+    reached = table[table['survival'] <= 0.5].drop_duplicates('group')
+    medians = pd.Series(np.inf, index=pd.Index(groups, name='group'), name='median_survival')
+    medians.loc[reached['group'].to_numpy()] = reached['time'].to_numpy()
+    return medians
@@ -0,0 +1,271 @@
+import base64
+
+import numpy as np
+import pandas as pd
+
+
+def hash_values(values):
+    # ✅ 실행마다 동일한 64비트 해시 (파이썬 hash()는 프로세스마다 달라 저장/병합에 쓸 수 없음)
+    values = np.asarray(pd.Series(values, dtype=object).dropna().astype(str).to_numpy(), dtype=object)
+    return pd.util.hash_array(values)
+
+
+class HyperLogLog:
+    """
+    병합 가능한 고유값 개수 스케치.
+    - 원소가 sparse_limit개 이하일 때는 해시 집합을 그대로 보관 → 정확한 값
+    - 그 이상이면 2^p개 레지스터로 전환 → 상대 표준오차 ≈ 1.04 / sqrt(2^p) (p=14: 약 0.8%)
+    레지스터는 2^p 바이트(p=14: 16KB)로 고정되어 원소 수와 무관하게 메모리가 일정하다.
+    """
+
+    def __init__(self, p=14, sparse_limit=4096):
+        self.p = p
+        self.m = 1 << p
+        self.sparse_limit = sparse_limit
+        self.sparse = set()
+        self.registers = None
+
+    def add(self, values):
+        hashes = hash_values(values)
+        if self.registers is None:
+            self.sparse.update(hashes.tolist())
+            if len(self.sparse) > self.sparse_limit:
+                self._densify()
+        else:
+            self._add_hashes(hashes)
+        return self
+
+    def _densify(self):
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+        self._add_hashes(np.fromiter(self.sparse, dtype=np.uint64, count=len(self.sparse)))
+        self.sparse = set()
+
+    def _add_hashes(self, hashes):
+        # 상위 p비트 = 레지스터 번호, 다음 32비트의 선행 0 개수 + 1 = 순위
+        if len(hashes) == 0:
+            return
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        w = ((hashes >> np.uint64(32 - self.p)) & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        rank = np.where(w > 0, 32 - np.floor(np.log2(np.maximum(w, 1))), 33).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def count(self):
+        if self.registers is None:
+            return len(self.sparse)
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        estimate = alpha * self.m ** 2 / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * self.m and zeros:
+            estimate = self.m * np.log(self.m / zeros)  # 작은 범위 보정 (linear counting)
+        return int(round(estimate))
+
+    def merge(self, other):
+        if self.p != other.p:
+            raise ValueError("정밀도(p)가 다른 HyperLogLog는 병합할 수 없습니다.")
+        if self.registers is None and other.registers is None:
+            self.sparse |= other.sparse
+            if len(self.sparse) > self.sparse_limit:
+                self._densify()
+            return self
+        if self.registers is None:
+            self._densify()
+        if other.registers is None:
+            self._add_hashes(np.fromiter(other.sparse, dtype=np.uint64, count=len(other.sparse)))
+        else:
+            np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def to_dict(self):
+        state = {'p': self.p, 'sparse_limit': self.sparse_limit}
+        if self.registers is None:
+            state['sparse'] = sorted(self.sparse)
+        else:
+            state['registers'] = base64.b64encode(self.registers.tobytes()).decode('ascii')
+        return state
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(p=state['p'], sparse_limit=state['sparse_limit'])
+        if 'registers' in state:
+            sketch.registers = np.frombuffer(base64.b64decode(state['registers']), dtype=np.uint8).copy()
+        else:
+            sketch.sparse = set(state.get('sparse', []))
+        return sketch
+
+
+class KLLSketch:
+    """
+    병합 가능한 분위수 스케치 (KLL).
+    정규화 순위 오차 ≈ 1.65 / k^0.92 수준 (k=200: 약 1.3%, 99% 신뢰) 이며
+    메모리는 원소 수와 무관하게 O(k · log(n/k))개 float로 제한된다.
+    """
+
+    def __init__(self, k=200, seed=0):
+        self.k = k
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        height = len(self.levels)
+        return max(2, int(np.ceil(self.k * (2 / 3) ** (height - 1 - level))))
+
+    def add(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return self
+        self.n += values.size
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def _compress(self):
+        # ✅ 용량을 넘은 층을 정렬 후 절반(짝/홀 무작위)만 다음 층으로 올린다 (가중치 2배)
+        while True:
+            for h, items in enumerate(self.levels):
+                if len(items) > self._capacity(h):
+                    break
+            else:
+                return
+            items = np.sort(items)
+            keep = items[:1] if len(items) % 2 else items[:0]
+            items = items[len(keep):]
+            promoted = items[self._rng.integers(2)::2]
+            if h + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = keep
+            self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+
+    def quantiles(self, qs):
+        # ✅ 가중치(2^층) 누적 분포에서 분위수 조회
+        qs = np.atleast_1d(np.asarray(qs, dtype=np.float64))
+        if self.n == 0:
+            return np.full(qs.shape, np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(lv), 2.0 ** h) for h, lv in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cum = items[order], np.cumsum(weights[order])
+        pos = np.searchsorted(cum, qs * cum[-1], side='left')
+        result = items[np.clip(pos, 0, len(items) - 1)]
+        result[qs <= 0] = self.min
+        result[qs >= 1] = self.max
+        return result
+
+    def quantile(self, q):
+        return float(self.quantiles([q])[0])
+
+    def merge(self, other):
+        if self.k != other.k:
+            raise ValueError("k가 다른 KLL 스케치는 병합할 수 없습니다.")
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def to_dict(self):
+        return {
+            'k': self.k,
+            'n': self.n,
+            'min': float(self.min) if self.n else None,
+            'max': float(self.max) if self.n else None,
+            'levels': [base64.b64encode(items.astype(np.float64).tobytes()).decode('ascii') for items in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(k=state['k'])
+        sketch.n = state['n']
+        if sketch.n:
+            sketch.min, sketch.max = state['min'], state['max']
+        sketch.levels = [np.frombuffer(base64.b64decode(items), dtype=np.float64).copy() for items in state['levels']]
+        return sketch
+
+
+class CountMinSketch:
+    """
+    병합 가능한 빈도 스케치 + 상위 빈도 후보(heavy hitters) 추적.
+    추정값은 실제값 이상이며, 확률 1-δ로 실제값 + ε·N 이하 (ε = e/width, δ = e^-depth).
+    기본값(width=2048, depth=5): ε ≈ 0.13%, δ ≈ 0.7%.
+    """
+
+    def __init__(self, width=2048, depth=5, track=50):
+        self.width = width
+        self.depth = depth
+        self.track = track
+        self.total = 0
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.candidates = {}
+
+    def _indexes(self, hashes):
+        # 이중 해싱: h1 + i·h2 (mod width)
+        h1 = (hashes & np.uint64(0xFFFFFFFF)).astype(np.int64)
+        h2 = (hashes >> np.uint64(32)).astype(np.int64) | 1
+        rows = np.arange(self.depth, dtype=np.int64)[:, None]
+        return (h1[None, :] + rows * h2[None, :]) % self.width
+
+    def add(self, values):
+        counts = pd.Series(values, dtype=object).dropna().astype(str).value_counts()
+        if counts.empty:
+            return self
+        keys = counts.index.to_numpy(dtype=object)
+        idx = self._indexes(hash_values(keys))
+        for row in range(self.depth):
+            np.add.at(self.table[row], idx[row], counts.to_numpy())
+        self.total += int(counts.sum())
+        self._refresh_candidates(keys)
+        return self
+
+    def estimate(self, keys):
+        keys = np.asarray(pd.Series(keys, dtype=object).astype(str).to_numpy(), dtype=object)
+        if len(keys) == 0:
+            return np.zeros(0, dtype=np.int64)
+        idx = self._indexes(hash_values(keys))
+        return self.table[np.arange(self.depth)[:, None], idx].min(axis=0)
+
+    def _refresh_candidates(self, new_keys):
+        # ✅ 기존 후보 + 새 키를 다시 추정해 상위 track개만 보관
+        keys = np.asarray(list(self.candidates) + [k for k in new_keys if k not in self.candidates], dtype=object)
+        estimates = self.estimate(keys)
+        if len(keys) > self.track:
+            top = np.argpartition(-estimates, self.track - 1)[:self.track]
+            keys, estimates = keys[top], estimates[top]
+        self.candidates = dict(zip(keys.tolist(), estimates.tolist()))
+
+    def heavy_hitters(self, n=10):
+        return sorted(self.candidates.items(), key=lambda x: -x[1])[:n]
+
+    def merge(self, other):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("크기가 다른 Count-Min 스케치는 병합할 수 없습니다.")
+        self.table += other.table
+        self.total += other.total
+        self._refresh_candidates(list(other.candidates))
+        return self
+
+    def to_dict(self):
+        return {
+            'width': self.width,
+            'depth': self.depth,
+            'track': self.track,
+            'total': self.total,
+            'table': base64.b64encode(self.table.tobytes()).decode('ascii'),
+            'candidates': self.candidates,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(width=state['width'], depth=state['depth'], track=state['track'])
+        sketch.total = state['total']
+        sketch.table = np.frombuffer(base64.b64decode(state['table']), dtype=np.int64).reshape(sketch.depth, sketch.width).copy()
+        sketch.candidates = dict(state['candidates'])
+        return sketch
@@ -2,6 +2,7 @@ import os
 import csv
 import time
 import re
+import logging
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -12,6 +13,10 @@ from dotenv import load_dotenv
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from src.instrumentation import timed, record_rows, instrument_driver
+
+logger = logging.getLogger(__name__)
+
 class SeleniumTwitterCollector:
     def __init__(self, save_dir, show_browser=True):
         # 저장 디렉토리 생성
@@ -38,7 +43,7 @@ class SeleniumTwitterCollector:
         options.add_experimental_option('useAutomationExtension', False)
 
         # 크롬 드라이버 실행
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        self.driver = instrument_driver(webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options))
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         print("🌐 브라우저 초기화 및 실행 완료")
 
@@ -64,6 +69,7 @@ class SeleniumTwitterCollector:
         time.sleep(3)
         print("✅ 로그인 완료!")
 
+    @timed
     def extract_engagement_counts(self, card):
         # 좋아요, 리트윗, 댓글 수, 조회수 추출 함수
         likes = '0'
@@ -74,17 +80,16 @@ class SeleniumTwitterCollector:
         try:
             container = card.find_element(By.CSS_SELECTOR, 'div[aria-label*="likes"]')
             aria_label = container.get_attribute('aria-label')
-            print("=" * 50)
-            print("aria-label 내용:", aria_label)
-            print("=" * 50)
+            logger.debug("aria-label 내용: %s", aria_label)
             match = re.search(r'(\d+(?:,\d+)?) replies?, (\d+(?:,\d+)?) reposts?, (\d+(?:,\d+)?) likes?,?.*?(\d+(?:,\d+)?) views?', aria_label)
             if match:
                 replies, retweets, likes, views = match.groups()
         except Exception as e:
-            print(f"[디버그] aria-label 파싱 실패: {e}")
+            logger.debug("aria-label 파싱 실패: %s", e)
 
         return likes, retweets, replies, views
 
+    @timed
     def search_posts(self, keyword, max_posts=1000):
         print(f"🔍 '{keyword}' 검색 시작...")
         self.load_cookies()
@@ -150,7 +155,7 @@ class SeleniumTwitterCollector:
                     posts.append(post)
                     new_count += 1
 
-                    print(f"📥 {username}: ❤️{likes} 🔁{retweets} 💬{replies} 👁️{views}")
+                    logger.debug("📥 %s: ❤️%s 🔁%s 💬%s 👁️%s", username, likes, retweets, replies, views)
 
                     if len(posts) >= max_posts:
                         break
@@ -167,6 +172,7 @@ class SeleniumTwitterCollector:
             scroll_count += 1
 
         print(f"🎉 총 {len(posts)}개 트윗 수집 완료")
+        record_rows(len(posts))
         return posts
 
     def save_posts(self, posts, meme_name):
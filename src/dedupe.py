@@ -0,0 +1,132 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+
+class SeenFilter:
+    """
+    스냅샷 간 트윗 중복 제거용 확장형 Bloom 필터 ("이미 합산한 트윗인가?").
+    - 메모리/파일 크기는 누적 트윗 수가 아니라 용량(capacity)으로 정해진다
+      (capacity=1,000,000, error_rate=0.001 → 약 2MB). 용량을 넘으면 2배 용량의 층을 추가하고
+      층마다 오탐률을 절반으로 줄여(error_rate/2, /4, ...), 전체 오탐률은 error_rate 이하로 유지된다.
+    - 오탐(처음 보는 트윗을 본 것으로 판정)이 나면 그 트윗은 건너뛰므로 집계가 오탐률만큼 과소 추정될 수 있다.
+      미탐은 없다 (한 번 합산한 트윗은 항상 걸러진다).
+    - path를 주면 비트 배열을 <path>_<층>.npy 메모리 맵으로 두어, 저장 시 배치가 건드린 페이지만 기록된다.
+    """
+
+    def __init__(self, capacity=1_000_000, error_rate=0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.path = None
+        self.layers = []
+
+    # ---------- 조회/추가 ----------
+    def unseen(self, keys):
+        # ✅ 처음 보는 키의 마스크 반환 후 모두 기록 (같은 배치 안의 중복은 첫 번째만 True)
+        hashes = pd.util.hash_array(pd.Series(keys, dtype=object).astype(str).to_numpy(dtype=object))
+        if len(hashes) == 0:
+            return np.zeros(0, dtype=bool)
+        mask = ~self._contains(hashes) & ~pd.Series(hashes).duplicated().to_numpy()
+        self._add(hashes[mask])
+        return mask
+
+    def filter(self, df, key_col='url'):
+        # ✅ 아직 보지 않은 행만 남김 (key_col이 없으면 그대로 반환)
+        if key_col not in df.columns:
+            return df
+        return df[self.unseen(df[key_col])]
+
+    def _contains(self, hashes):
+        found = np.zeros(len(hashes), dtype=bool)
+        for layer in self.layers:
+            positions = self._positions(hashes, layer)
+            bits = (layer['bits'][positions >> 3] >> (positions & 7).astype(np.uint8)) & 1
+            found |= bits.all(axis=1).astype(bool)
+        return found
+
+    def _add(self, hashes):
+        while len(hashes):
+            last = self.layers[-1] if self.layers else None
+            if last is None or last.get('sealed') or last['count'] >= last['capacity']:
+                self._add_layer()
+            layer = self.layers[-1]
+            take = hashes[:layer['capacity'] - layer['count']]
+            hashes = hashes[len(take):]
+            positions = self._positions(take, layer).ravel()
+            np.bitwise_or.at(layer['bits'], positions >> 3, (1 << (positions & 7)).astype(np.uint8))
+            layer['count'] += len(take)
+
+    @staticmethod
+    def _positions(hashes, layer):
+        # 이중 해싱: 64비트 해시의 상·하위 32비트로 k개 비트 위치 생성
+        h1 = (hashes & np.uint64(0xFFFFFFFF)).astype(np.int64)
+        h2 = (hashes >> np.uint64(32)).astype(np.int64) | 1
+        return (h1[:, None] + np.arange(layer['k'], dtype=np.int64) * h2[:, None]) % layer['m']
+
+    def _add_layer(self):
+        i = len(self.layers)
+        capacity = self.capacity * (2 ** i)
+        error_rate = self.error_rate / (2 ** (i + 1))
+        m = int(np.ceil(-capacity * np.log(error_rate) / np.log(2) ** 2 / 8)) * 8
+        k = max(1, int(round(m / capacity * np.log(2))))
+        layer = {'capacity': capacity, 'error_rate': error_rate, 'm': m, 'k': k, 'count': 0}
+        layer['bits'] = self._open_bits(i, m // 8, create=True)
+        self.layers.append(layer)
+
+    def count(self):
+        # ✅ 기록된 (서로 다른) 키 수 — 오탐으로 걸러진 키는 포함되지 않음
+        return sum(layer['count'] for layer in self.layers)
+
+    def merge(self, other):
+        # ✅ 합집합: 다른 필터의 층을 그대로 덧붙인다 (어느 층에든 있으면 본 것으로 판정)
+        for layer in other.layers:
+            copied = {k: v for k, v in layer.items() if k != 'bits'}
+            copied['sealed'] = True  # 덧붙인 층에는 더 기록하지 않음
+            copied['bits'] = self._open_bits(len(self.layers), len(layer['bits']), create=True)
+            copied['bits'][:] = layer['bits']
+            self.layers.append(copied)
+        return self
+
+    # ---------- 저장/불러오기 ----------
+    def _layer_path(self, i):
+        return f"{self.path}_{i}.npy"
+
+    def _open_bits(self, i, n_bytes, create=False):
+        if self.path is None:
+            return np.zeros(n_bytes, dtype=np.uint8)
+        if create:
+            return np.lib.format.open_memmap(self._layer_path(i), mode='w+', dtype=np.uint8, shape=(n_bytes,))
+        return np.load(self._layer_path(i), mmap_mode='r+')
+
+    def persist(self, path):
+        # ✅ path 기반 메모리 맵으로 전환 (이미 같은 path면 변경된 페이지만 디스크에 반영)
+        if self.path != path:
+            self.path = path
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            for i, layer in enumerate(self.layers):
+                bits = self._open_bits(i, len(layer['bits']), create=True)
+                bits[:] = layer['bits']
+                layer['bits'] = bits
+        for layer in self.layers:
+            if isinstance(layer['bits'], np.memmap):
+                layer['bits'].flush()
+        return self
+
+    def to_dict(self):
+        # 비트 배열은 .npy 파일에 있으므로 층 메타데이터만 직렬화
+        return {
+            'capacity': self.capacity,
+            'error_rate': self.error_rate,
+            'layers': [{k: v for k, v in layer.items() if k != 'bits'} for layer in self.layers],
+        }
+
+    @classmethod
+    def from_dict(cls, state, path):
+        obj = cls(state['capacity'], state['error_rate'])
+        obj.path = path
+        for i, meta in enumerate(state['layers']):
+            layer = dict(meta)
+            layer['bits'] = obj._open_bits(i, meta['m'] // 8)
+            obj.layers.append(layer)
+        return obj
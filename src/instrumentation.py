@@ -0,0 +1,257 @@
+import os
+import sys
+import json
+import time
+import functools
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+# 현재 실행 중인 RunRecorder (timed/record_rows/instrument_driver가 기록할 대상)
+_active_recorder = None
+
+
+def current_rss_mb():
+    # ✅ 현재 RSS(MB): psutil → /proc/self/statm(Linux) 순으로 시도, 둘 다 없으면 None
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class RSSSampler:
+    """단계 실행 중 현재 RSS를 interval초마다 읽어 단계 구간의 최대값을 구하는 백그라운드 스레드"""
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.start_mb = self.peak_mb = current_rss_mb()
+        self._stop = threading.Event()
+        self._thread = None
+        self.end_mb = None
+
+    def start(self):
+        if self.start_mb is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.end_mb = current_rss_mb()
+        if self.end_mb is not None:
+            self.peak_mb = max(self.peak_mb, self.end_mb)
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            rss = current_rss_mb()
+            if rss is not None and rss > self.peak_mb:
+                self.peak_mb = rss
+
+
+def peak_rss_mb():
+    # ✅ 프로세스 시작 이후 최대 RSS(MB, 단계별 값 아님). resource가 없는 Windows는 psutil(현재 RSS)로 대체
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().rss / (1024 * 1024)
+        except ImportError:
+            return None
+
+
+class RunRecorder:
+    """
+    파이프라인 실행 1회의 단계별 계측 기록.
+    단계별 소요 시간, 단계 구간 RSS(시작/종료/샘플링 최대), 초당 처리 행 수, WebDriver 호출 수와
+    함수별 누적 시간을 모아
+    results/reports/run_<시각>_<이름>.json 으로 저장한다.
+    profile='cprofile' 또는 'pyinstrument'이면 단계마다 프로파일 파일도 남긴다.
+    """
+
+    def __init__(self, run_name, output_dir, profile=None, metadata=None):
+        self.run_name = run_name
+        self.output_dir = output_dir
+        self.profile = profile
+        self.run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{run_name.replace(' ', '_').lower()}"
+        self.metadata = metadata or {}
+        self.stages = []
+        self.functions = {}
+        self.webdriver_calls = Counter()
+        self._current_stage = None
+        self._started_at = None
+        self._start = None
+
+    def __enter__(self):
+        global _active_recorder
+        _active_recorder = self
+        self._started_at = datetime.now().isoformat(timespec='seconds')
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _active_recorder
+        _active_recorder = None
+        self.save(status='failed' if exc_type else 'ok')
+        return False
+
+    @contextmanager
+    def stage(self, name):
+        # ✅ 단계 계측: 벽시계 시간, 단계 구간 RSS, 처리 행 수, WebDriver 호출 수
+        record = {'name': name, 'rows': None}
+        calls_before = sum(self.webdriver_calls.values())
+        self._current_stage = record
+        sampler = RSSSampler().start()
+        profiler = self._start_profiler()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['wall_s'] = round(time.perf_counter() - start, 4)
+            self._stop_profiler(profiler, name)
+            sampler.stop()
+            # rss_peak_mb는 샘플링 간격(50ms)보다 짧은 순간 최대값은 놓칠 수 있다
+            record['rss_start_mb'] = sampler.start_mb
+            record['rss_end_mb'] = sampler.end_mb
+            record['rss_peak_mb'] = sampler.peak_mb
+            record['process_peak_rss_mb'] = peak_rss_mb()
+            record['webdriver_calls'] = sum(self.webdriver_calls.values()) - calls_before
+            if record['rows'] and record['wall_s'] > 0:
+                record['rows_per_s'] = round(record['rows'] / record['wall_s'], 1)
+            self.stages.append(record)
+            self._current_stage = None
+            print(f"⏱️ [{name}] {record['wall_s']:.2f}s"
+                  + (f", {record['rows']}행" if record['rows'] else ""))
+
+    def _start_profiler(self):
+        if self.profile == 'cprofile':
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+            return profiler
+        if self.profile == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                print("[경고] pyinstrument가 설치되어 있지 않아 프로파일링을 건너뜁니다.")
+                return None
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+        return None
+
+    def _stop_profiler(self, profiler, stage_name):
+        if profiler is None:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"{self.run_id}_{stage_name}")
+        if self.profile == 'cprofile':
+            profiler.disable()
+            profiler.dump_stats(base + '.prof')
+        else:
+            profiler.stop()
+            with open(base + '.html', 'w', encoding='utf-8') as f:
+                f.write(profiler.output_html())
+
+    def record_function(self, name, elapsed):
+        entry = self.functions.setdefault(name, {'calls': 0, 'total_s': 0.0})
+        entry['calls'] += 1
+        entry['total_s'] += elapsed
+
+    def to_dict(self, status='ok'):
+        return {
+            'run_id': self.run_id,
+            'run_name': self.run_name,
+            'status': status,
+            'started_at': self._started_at,
+            'wall_s': round(time.perf_counter() - self._start, 4) if self._start else None,
+            'process_peak_rss_mb': peak_rss_mb(),
+            'python': sys.version.split()[0],
+            'argv': sys.argv,
+            'metadata': self.metadata,
+            'stages': self.stages,
+            'functions': {name: {'calls': v['calls'], 'total_s': round(v['total_s'], 4)}
+                          for name, v in sorted(self.functions.items(), key=lambda x: -x[1]['total_s'])},
+            'webdriver_calls': dict(self.webdriver_calls),
+        }
+
+    def save(self, status='ok'):
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"{self.run_id}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(status), f, ensure_ascii=False, indent=2, default=str)
+        print(f"📈 실행 기록 저장: {path}")
+        return path
+
+
+def timed(func):
+    # ✅ 실행 중인 RunRecorder가 있으면 함수별 호출 수/누적 시간 기록 (없으면 그대로 실행)
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _active_recorder is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _active_recorder.record_function(name, time.perf_counter() - start)
+    return wrapper
+
+
+def record_rows(rows):
+    # ✅ 현재 단계에서 처리한 행 수 기록 (rows/s 계산용)
+    if _active_recorder is not None and _active_recorder._current_stage is not None:
+        _active_recorder._current_stage['rows'] = int(rows)
+
+
+# 속성 접근이지만 실제로는 WebDriver 왕복 호출이 일어나는 프로퍼티
+_REMOTE_PROPERTIES = {'text', 'tag_name', 'size', 'location', 'rect', 'page_source', 'current_url', 'title'}
+
+
+class _CountingProxy:
+    """WebDriver/WebElement 메서드 호출 수를 세는 프록시 (반환된 WebElement도 감싼다)"""
+
+    def __init__(self, target, counter):
+        self._target = target
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            if name in _REMOTE_PROPERTIES:
+                self._counter[name] += 1
+            return attr
+
+        def call(*args, **kwargs):
+            self._counter[name] += 1
+            return _wrap(attr(*args, **kwargs), self._counter)
+        return call
+
+
+def _wrap(result, counter):
+    if isinstance(result, list):
+        return [_wrap(item, counter) for item in result]
+    if hasattr(result, 'find_element') and not isinstance(result, _CountingProxy):
+        return _CountingProxy(result, counter)
+    return result
+
+
+def instrument_driver(driver):
+    # ✅ 실행 중인 RunRecorder가 있으면 WebDriver 호출 수를 세는 프록시로 감싼다
+    if _active_recorder is None:
+        return driver
+    return _CountingProxy(driver, _active_recorder.webdriver_calls)
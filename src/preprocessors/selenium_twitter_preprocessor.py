@@ -4,20 +4,27 @@ import numpy as np
 import re
 from datetime import datetime
 import sys
-from sklearn.cluster import KMeans
-from sklearn.decomposition import PCA
-from sentence_transformers import SentenceTransformer
 
 # ✅ 경로 설정 (상위 디렉토리에서 config 불러오기 위해 sys.path 추가)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.config import RAW_DATA_DIR, PROCESSED_DATA_DIR
+from src.analyzers.selenium_twitter_approx_stats import ApproximateSummary
+from src.instrumentation import timed
 
 class SeleniumTwitterPreprocessor:
-    def __init__(self):
-        # ✅ 디렉토리 경로 설정 및 문장 임베딩 모델 로딩
+    def __init__(self, embedder=None):
+        # ✅ 디렉토리 경로 설정 (문장 임베딩 모델은 클러스터링 시점에 로딩, 외부 주입 가능)
         self.raw_data_dir = RAW_DATA_DIR
         self.processed_data_dir = PROCESSED_DATA_DIR
-        self.embedder = SentenceTransformer('all-MiniLM-L6-v2')
+        self._embedder = embedder
+
+    @property
+    def embedder(self):
+        # ✅ sentence_transformers(torch)는 클러스터링할 때만 import/로딩
+        if self._embedder is None:
+            from sentence_transformers import SentenceTransformer
+            self._embedder = SentenceTransformer('all-MiniLM-L6-v2')
+        return self._embedder
 
     def load_twitter_data(self, filename):
         # ✅ 원시 트위터 데이터 CSV 로드
@@ -26,6 +33,7 @@ class SeleniumTwitterPreprocessor:
         print(f"📅 데이터 로드 완료: {len(df)}개 게시물")
         return df
 
+    @timed
     def preprocess(self, df):
         print("\n🧹=== 트위터 데이터 전처리 시작 ===")
 
@@ -84,8 +92,12 @@ class SeleniumTwitterPreprocessor:
             'day_dist': day_dist
         }
 
+    @timed
     def perform_clustering(self, df, n_clusters=5):
         # ✅ 문장 임베딩 후 PCA 축소 + KMeans 클러스터링
+        from sklearn.cluster import KMeans
+        from sklearn.decomposition import PCA
+
         print("\n🔗=== 클러스터링 시작 ===")
         embeddings = self.embedder.encode(df['text_clean'].tolist(), show_progress_bar=True)
         pca = PCA(n_components=2)
@@ -97,6 +109,7 @@ class SeleniumTwitterPreprocessor:
         print(f"🎯 클러스터링 완료 (군집 수: {n_clusters})")
         return df
 
+    @timed
     def estimate_last_seen(self, df):
         # ✅ 동일한 텍스트 기준 마지막 등장 시점 추정
         print("\n🔍=== 생존 분석용 마지막 등장 시점 추정 ===")
@@ -106,21 +119,28 @@ class SeleniumTwitterPreprocessor:
         print("✅ last_seen_at 컬럼 생성 완료")
         return df
 
-    def save_processed_data(self, df, output_filename):
+    @timed
+    def save_processed_data(self, df, output_filename, approximate=False):
         # ✅ 전처리된 데이터 및 요약 통계 저장
         os.makedirs(self.processed_data_dir, exist_ok=True)
         output_path = os.path.join(self.processed_data_dir, output_filename)
         df.to_csv(output_path, index=False)
         print(f"📂 전처리된 데이터 저장: {output_path}")
 
-        summary = {
-            'total_posts': len(df),
-            'date_range': f"{df['created_at'].min()} ~ {df['created_at'].max()}",
-            'unique_authors': df['author'].nunique(),
-            'avg_likes': df['likes'].mean(),
-            'avg_retweets': df['retweets'].mean(),
-            'avg_views': df['views'].mean()
-        }
+        if approximate:
+            # ✅ 스케치 기반 요약 + 병합 가능한 스케치 상태(_sketch.json) 저장
+            approx = ApproximateSummary().update(df)
+            approx.save(output_path.replace('.csv', '_sketch.json'))
+            summary = approx.summary()
+        else:
+            summary = {
+                'total_posts': len(df),
+                'date_range': f"{df['created_at'].min()} ~ {df['created_at'].max()}",
+                'unique_authors': df['author'].nunique(),
+                'avg_likes': df['likes'].mean(),
+                'avg_retweets': df['retweets'].mean(),
+                'avg_views': df['views'].mean()
+            }
 
         summary_path = output_path.replace('.csv', '_summary.txt')
         with open(summary_path, 'w', encoding='utf-8') as f:
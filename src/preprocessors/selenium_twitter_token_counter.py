@@ -0,0 +1,189 @@
+import os
+import re
+import json
+import hashlib
+from collections import Counter
+
+import pandas as pd
+
+from src.dedupe import SeenFilter
+
+# ✅ 토큰화 규칙: 한글 덩어리 / 영문·숫자 단어만 토큰으로 인정
+TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-zA-Z][a-zA-Z0-9_']*")
+MENTION_PATTERN = re.compile(r"@\w+")
+HASHTAG_SPLIT_PATTERN = re.compile(r"[,\s]+")
+
+# ✅ 한글 토큰 끝에 붙는 대표적인 조사 (긴 것부터 검사)
+KOREAN_PARTICLES = (
+    '에서', '에게', '한테', '까지', '부터', '처럼', '으로',
+    '은', '는', '이', '가', '을', '를', '의', '에', '로', '와', '과', '도', '만',
+)
+
+STOPWORDS = {
+    # 영어
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'any', 'can', 'her', 'was',
+    'one', 'our', 'out', 'his', 'has', 'had', 'him', 'how', 'its', 'who', 'did', 'get',
+    'this', 'that', 'with', 'have', 'from', 'they', 'will', 'what', 'when', 'your',
+    'just', 'like', 'been', 'were', 'them', 'than', 'then', 'there', 'their', 'about',
+    'into', 'more', 'some', 'also', 'only', 'very', 'here', 'it\'s', 'i\'m', 'don\'t',
+    'is', 'it', 'in', 'on', 'of', 'to', 'at', 'be', 'by', 'or', 'an', 'as', 'so', 'if',
+    'my', 'me', 'we', 'he', 'she', 'do', 'no', 'up', 'rt', 'https', 'http', 'amp',
+    # 한국어
+    '그리고', '그래서', '하지만', '그런데', '진짜', '너무', '정말', '이거', '그거', '저거',
+    '이번', '우리', '저는', '나는', '있는', '없는', '하는', '있다', '없다', '한다', '합니다',
+    '에서', '으로', '에게', '근데', '그냥', '아니', '이제', '지금', '오늘',
+}
+
+
+def parse_hashtags(value):
+    # ✅ 수집기의 hashtags 필드("#a,#b")를 소문자 태그 리스트로 변환 (공백 구분도 허용)
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return []
+    return [tag.lower() for tag in HASHTAG_SPLIT_PATTERN.split(str(value)) if tag.startswith('#') and len(tag) > 1]
+
+
+def strip_particle(token):
+    # ✅ 한글 토큰의 조사 제거 (어간이 최소 2글자 남을 때만)
+    for particle in KOREAN_PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= 2:
+            return token[:-len(particle)]
+    return token
+
+
+def tokenize(text, stopwords=STOPWORDS, min_length=2):
+    # ✅ 멘션 제거 → 정규식 토큰화 → 소문자/조사 제거 → 불용어·짧은 토큰 제외
+    if not isinstance(text, str) or not text:
+        return []
+    text = MENTION_PATTERN.sub(' ', text)
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text):
+        if token[0] >= '가':
+            token = strip_particle(token)
+        else:
+            token = token.lower()
+        if len(token) >= min_length and token not in stopwords:
+            tokens.append(token)
+    return tokens
+
+
+class SeleniumTwitterTokenCounter:
+    """
+    토큰/해시태그 빈도를 청크 단위로 누적하는 스트리밍 집계기.
+    max_vocab을 넘으면 하위 빈도 항목을 잘라내 메모리를 제한하고(상위 항목은 근사),
+    처리한 스냅샷 ID와 트윗 URL(SeenFilter, 크기 고정 Bloom 필터)을 기록해 같은 스냅샷·같은 트윗을 두 번 합산하지 않는다.
+    (스냅샷끼리 겹치는 트윗은 처음 본 한 번만 집계되므로 결과는 지금까지 수집한 트윗 전체의 누적 빈도,
+    Bloom 필터 오탐률(기본 0.1% 이하)만큼 새 트윗이 누락될 수 있다)
+    """
+
+    def __init__(self, chunk_size=5000, max_vocab=50000, stopwords=STOPWORDS):
+        self.chunk_size = chunk_size
+        self.max_vocab = max_vocab
+        self.stopwords = stopwords
+        self.tokens = Counter()
+        self.hashtags = Counter()
+        self.sources = []
+        self.seen = SeenFilter()
+
+    # ---------- 누적 ----------
+    def update(self, df, text_col='text_clean', hashtag_col='hashtags', key_col='url'):
+        # ✅ DataFrame을 chunk_size 행씩 나누어 카운트 누적 (이미 집계한 트윗은 건너뜀)
+        for start in range(0, len(df), self.chunk_size):
+            self._update_chunk(df.iloc[start:start + self.chunk_size], text_col, hashtag_col, key_col)
+        return self
+
+    def update_from_csv(self, filepath, source_id=None, text_col='text_clean', hashtag_col='hashtags', key_col='url'):
+        # ✅ CSV를 chunksize로 스트리밍 읽기 (전체 파일을 메모리에 올리지 않음)
+        source_id = source_id or self.source_id(filepath)
+        if source_id in self.sources:
+            print(f"↩️ 이미 집계된 스냅샷입니다: {source_id}")
+            return False
+
+        header = pd.read_csv(filepath, nrows=0).columns
+        usecols = [c for c in (text_col, hashtag_col, key_col) if c in header]
+        if text_col not in usecols and 'text' in header:
+            text_col = 'text'
+            usecols.append('text')
+
+        for chunk in pd.read_csv(filepath, usecols=usecols, chunksize=self.chunk_size):
+            self._update_chunk(chunk, text_col, hashtag_col, key_col)
+
+        self.sources.append(source_id)
+        return True
+
+    def _update_chunk(self, chunk, text_col, hashtag_col, key_col):
+        chunk = self.seen.filter(chunk, key_col)  # 이전 스냅샷/같은 청크에서 이미 집계한 트윗 제외
+        if text_col in chunk.columns:
+            for text in chunk[text_col]:
+                self.tokens.update(tokenize(text, self.stopwords))
+        if hashtag_col in chunk.columns:
+            for value in chunk[hashtag_col]:
+                # 해시태그는 트윗당 한 번만 센다 (해시태그 인덱스의 태그별 트윗 수와 같은 규칙)
+                self.hashtags.update(set(parse_hashtags(value)))
+        self._prune()
+
+    def _prune(self):
+        # ✅ 어휘 수가 max_vocab의 2배를 넘으면 상위 max_vocab개만 유지
+        if not self.max_vocab:
+            return
+        for name in ('tokens', 'hashtags'):
+            counter = getattr(self, name)
+            if len(counter) > 2 * self.max_vocab:
+                setattr(self, name, Counter(dict(counter.most_common(self.max_vocab))))
+
+    def merge(self, other):
+        # ✅ 다른 집계기(다른 스냅샷/프로세스)의 카운트를 병합 (서로 겹치지 않는 트윗을 집계한 경우에만 정확)
+        self.tokens.update(other.tokens)
+        self.hashtags.update(other.hashtags)
+        self.sources.extend(s for s in other.sources if s not in self.sources)
+        self.seen.merge(other.seen)
+        self._prune()
+        return self
+
+    # ---------- 조회 ----------
+    def top_tokens(self, n=200):
+        return dict(self.tokens.most_common(n))
+
+    def top_hashtags(self, n=20):
+        return self.hashtags.most_common(n)
+
+    # ---------- 저장/불러오기 ----------
+    @staticmethod
+    def source_id(filepath, block_size=1 << 20):
+        # ✅ 파일명 + 내용 해시로 스냅샷 식별 (같은 파일을 재처리해도 중복 집계 방지)
+        digest = hashlib.sha1()
+        with open(filepath, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+        return f"{os.path.basename(filepath)}:{digest.hexdigest()[:12]}"
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        state = {
+            'version': 2,
+            'sources': self.sources,
+            'seen': self.seen.persist(self._seen_path(path)).to_dict(),
+            'tokens': dict(self.tokens),
+            'hashtags': dict(self.hashtags),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        print(f"💾 토큰 빈도 저장: {path}")
+        return path
+
+    @staticmethod
+    def _seen_path(path):
+        # URL 필터 비트 배열은 JSON 옆의 <이름>_seen_<층>.npy 파일에 둔다 (저장 시 바뀐 부분만 기록)
+        return os.path.splitext(path)[0] + '_seen'
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        counter = cls(**kwargs)
+        if not os.path.exists(path):
+            return counter
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        counter.tokens = Counter(state.get('tokens', {}))
+        counter.hashtags = Counter(state.get('hashtags', {}))
+        counter.sources = list(state.get('sources', []))
+        counter.seen = SeenFilter.from_dict(state['seen'], cls._seen_path(path))
+        return counter
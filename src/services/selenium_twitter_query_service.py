@@ -0,0 +1,335 @@
+import os
+import glob
+import json
+import math
+import asyncio
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from urllib.parse import urlsplit, parse_qs, unquote
+
+from config.config import PROCESSED_DATA_DIR, FIGURES_DIR, REPORTS_DIR
+
+
+def meme_slug(meme_name):
+    return meme_name.replace(' ', '_').lower()
+
+
+def processed_path(meme_name):
+    return os.path.join(PROCESSED_DATA_DIR, f"processed_twitter_{meme_slug(meme_name)}.csv")
+
+
+def figures_dir(meme_name):
+    # ✅ 밈별 그래프는 FIGURES_DIR/<slug>/ 에, 비교 그래프 등 밈 공통 그래프는 FIGURES_DIR 바로 아래에 저장된다
+    return os.path.join(FIGURES_DIR, meme_slug(meme_name))
+
+
+def report_path(meme_name):
+    # ✅ 리포트는 원래 밈 이름("chill guy_report.txt")으로 저장되므로 slug가 같은 파일을 찾는다
+    slug = meme_slug(meme_name)
+    for path in sorted(glob.glob(os.path.join(REPORTS_DIR, '*_report.txt'))):
+        if meme_slug(os.path.basename(path)[:-len('_report.txt')]) == slug:
+            return path
+    return None
+
+
+class BadRequest(ValueError):
+    """잘못된 요청 파라미터 (400으로 응답)"""
+
+
+def int_param(query, name, default):
+    # ✅ 양의 정수 쿼리 파라미터 (잘못된 값이면 BadRequest → 400)
+    value = query.get(name, [str(default)])[0]
+    if not value.isdigit() or int(value) < 1:
+        raise BadRequest(f"'{name}'은(는) 1 이상의 정수여야 합니다: {value}")
+    return int(value)
+
+
+# ---------- 워커 프로세스에서 실행되는 집계 함수 (pickle 가능하도록 모듈 최상위에 둔다) ----------
+
+def compute_metrics(path, meme_name):
+    import pandas as pd
+    from src.analyzers.selenium_twitter_lifecycle_analyzer import SeleniumTwitterLifecycleAnalyzer
+
+    df = pd.read_csv(path)
+    df['date'] = pd.to_datetime(df['date'])
+    analyzer = SeleniumTwitterLifecycleAnalyzer(save_dir=REPORTS_DIR)
+    metrics, _, _ = analyzer.analyze(df, meme_name)
+    return metrics
+
+
+def compute_daily(path):
+    import pandas as pd
+
+    df = pd.read_csv(path, usecols=['date', 'likes', 'retweets', 'views'])
+    daily = df.groupby('date').agg(posts=('date', 'size'), likes=('likes', 'sum'),
+                                   retweets=('retweets', 'sum'), views=('views', 'sum'))
+    return daily.reset_index().to_dict(orient='records')
+
+
+def compute_hashtags(path, top_n):
+    from src.preprocessors.selenium_twitter_token_counter import SeleniumTwitterTokenCounter
+
+    counter = SeleniumTwitterTokenCounter()
+    counter.update_from_csv(path)
+    return [{'hashtag': tag, 'count': count} for tag, count in counter.top_hashtags(top_n)]
+
+
+# 워커 프로세스별 해시태그 인덱스 LRU 캐시: 경로 → (파일 지문, 데이터, 인덱스)
+# 인덱스마다 트윗 데이터를 통째로 들고 있으므로 최근에 조회한 밈 몇 개만 남긴다
+_HASHTAG_INDEXES = OrderedDict()
+HASHTAG_INDEX_CACHE_SIZE = 4
+
+
+def _hashtag_index(path):
+    from src.analyzers.selenium_twitter_hashtag_index import SeleniumTwitterHashtagIndex
+
+    stat = os.stat(path)
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    cached = _HASHTAG_INDEXES.get(path)
+    if cached is None or cached[0] != fingerprint:
+        cached = (fingerprint, *SeleniumTwitterHashtagIndex.from_csv(path))
+        _HASHTAG_INDEXES[path] = cached
+    _HASHTAG_INDEXES.move_to_end(path)
+    while len(_HASHTAG_INDEXES) > HASHTAG_INDEX_CACHE_SIZE:
+        _HASHTAG_INDEXES.popitem(last=False)
+    return cached[1], cached[2]
+
+
+def compute_tag_tweets(path, tag):
+    df, index = _hashtag_index(path)
+    return df.iloc[index.tweets_with(tag)].to_dict(orient='records')
+
+
+def compute_tag_cotags(path, tag, top_n):
+    _, index = _hashtag_index(path)
+    return [{'hashtag': t, 'count': c} for t, c in index.top_cotags(tag, top_n).items()]
+
+
+def compute_tag_trend(path, tag):
+    _, index = _hashtag_index(path)
+    trend = index.tag_trend(tag)
+    return [{'date': d.date(), 'posts': c} for d, c in trend.items()]
+
+
+def read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def to_jsonable(value):
+    # ✅ NaN/inf → null, 날짜 → 문자열, numpy 스칼라 → 파이썬 값
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if hasattr(value, 'item') and not isinstance(value, (str, bytes)):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class QueryCache:
+    """
+    파일 지문(mtime + 크기, 또는 내용 해시)을 키에 포함하는 LRU 캐시.
+    원본 파일이 바뀌면 지문이 달라져 자동으로 새로 계산된다.
+    """
+
+    def __init__(self, max_entries=128, hash_content=False):
+        self.max_entries = max_entries
+        self.hash_content = hash_content
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(self, path):
+        stat = os.stat(path)
+        if not self.hash_content:
+            return (stat.st_mtime_ns, stat.st_size)
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, self.entries[key]
+        self.misses += 1
+        return False, None
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def stats(self):
+        return {'entries': len(self.entries), 'max_entries': self.max_entries,
+                'hits': self.hits, 'misses': self.misses}
+
+
+class SeleniumTwitterQueryService:
+    """
+    전처리 데이터/리포트/그래프를 조회하는 로컬 asyncio HTTP 서비스.
+      GET /memes                          밈 목록
+      GET /memes/<meme>/metrics           수명 주기 지표 (analyze)
+      GET /memes/<meme>/daily             일별 게시물·반응 시계열
+      GET /memes/<meme>/hashtags?top=20   상위 해시태그
+      GET /memes/<meme>/report            텍스트 리포트
+      GET /memes/<meme>/tags/<tag>/tweets          해시태그를 사용한 트윗
+      GET /memes/<meme>/tags/<tag>/cotags?top=10   함께 쓰인 해시태그
+      GET /memes/<meme>/tags/<tag>/trend           해시태그 일별 트윗 수
+      GET /memes/<meme>/figures/<name>.png         밈별 그래프 이미지
+      GET /figures/<name>.png             밈 공통 그래프 이미지 (비교 분석 등)
+      GET /stats                          캐시 통계
+    pandas 집계는 프로세스 풀에서 실행해 이벤트 루프를 막지 않고,
+    같은 요청이 동시에 들어오면 한 번만 계산한다.
+    """
+
+    def __init__(self, workers=2, cache_size=128, hash_content=False):
+        self.cache = QueryCache(cache_size, hash_content=hash_content)
+        self.workers = workers
+        self.pool = None
+        self._inflight = {}
+
+    # ---------- 캐시 + 워커 풀 ----------
+    async def fingerprint(self, path):
+        # 내용 해시는 파일 전체를 읽으므로 스레드에서 계산 (mtime + 크기는 stat 한 번이라 바로 계산)
+        if self.cache.hash_content:
+            return await asyncio.get_running_loop().run_in_executor(None, self.cache.fingerprint, path)
+        return self.cache.fingerprint(path)
+
+    async def cached(self, kind, path, func, *args):
+        loop = asyncio.get_running_loop()
+        key = (kind, path, args, await self.fingerprint(path))
+        hit, value = self.cache.get(key)
+        if hit:
+            return value
+
+        if key not in self._inflight:
+            self._inflight[key] = loop.run_in_executor(self.pool, func, path, *args)
+        try:
+            value = to_jsonable(await self._inflight[key])
+        finally:
+            self._inflight.pop(key, None)
+        self.cache.put(key, value)
+        return value
+
+    # ---------- 라우팅 ----------
+    async def handle(self, method, target):
+        if method != 'GET':
+            return 405, {'error': 'GET만 지원합니다.'}
+        try:
+            return await self.route(target)
+        except BadRequest as e:
+            return 400, {'error': str(e)}
+
+    async def route(self, target):
+        url = urlsplit(target)
+        parts = [unquote(p) for p in url.path.strip('/').split('/') if p]
+        query = parse_qs(url.query)
+
+        if parts == ['memes']:
+            files = glob.glob(os.path.join(PROCESSED_DATA_DIR, 'processed_twitter_*.csv'))
+            return 200, sorted(os.path.basename(f)[len('processed_twitter_'):-len('.csv')] for f in files)
+        if parts == ['stats']:
+            return 200, self.cache.stats()
+        if len(parts) == 2 and parts[0] == 'figures':
+            return await self.figure(FIGURES_DIR, parts[1])
+        if len(parts) == 4 and parts[0] == 'memes' and parts[2] == 'figures':
+            if parts[1] in ('.', '..'):
+                raise BadRequest(f"잘못된 밈 이름입니다: {parts[1]}")
+            return await self.figure(figures_dir(parts[1]), parts[3])
+        if len(parts) == 5 and parts[0] == 'memes' and parts[2] == 'tags':
+            meme, tag, resource = parts[1], parts[3], parts[4]
+            path = processed_path(meme)
+            if not os.path.exists(path):
+                return 404, {'error': f"전처리된 데이터가 없습니다: {meme}"}
+            if resource == 'tweets':
+                return 200, await self.cached('tag_tweets', path, compute_tag_tweets, tag)
+            if resource == 'cotags':
+                top_n = int_param(query, 'top', 10)
+                return 200, await self.cached('tag_cotags', path, compute_tag_cotags, tag, top_n)
+            if resource == 'trend':
+                return 200, await self.cached('tag_trend', path, compute_tag_trend, tag)
+        if len(parts) == 3 and parts[0] == 'memes':
+            meme, resource = parts[1], parts[2]
+            if resource == 'report':
+                return await self.report(meme)
+            path = processed_path(meme)
+            if not os.path.exists(path):
+                return 404, {'error': f"전처리된 데이터가 없습니다: {meme}"}
+            if resource == 'metrics':
+                return 200, await self.cached('metrics', path, compute_metrics, meme)
+            if resource == 'daily':
+                return 200, await self.cached('daily', path, compute_daily)
+            if resource == 'hashtags':
+                top_n = int_param(query, 'top', 20)
+                return 200, await self.cached('hashtags', path, compute_hashtags, top_n)
+        return 404, {'error': f"알 수 없는 경로: {url.path}"}
+
+    async def read_file(self, path):
+        # ✅ 파일 내용도 지문 기반 캐시 (디스크 I/O는 스레드에서)
+        key = ('file', path, await self.fingerprint(path))
+        hit, value = self.cache.get(key)
+        if not hit:
+            value = await asyncio.get_running_loop().run_in_executor(None, read_bytes, path)
+            self.cache.put(key, value)
+        return value
+
+    async def report(self, meme):
+        path = report_path(meme)
+        if path is None:
+            return 404, {'error': f"리포트가 없습니다: {meme}"}
+        return 200, ('text/plain; charset=utf-8', await self.read_file(path))
+
+    async def figure(self, directory, name):
+        if os.path.basename(name) != name or not name.endswith('.png'):
+            return 400, {'error': '잘못된 그래프 이름입니다.'}
+        path = os.path.join(directory, name)
+        if not os.path.exists(path):
+            return 404, {'error': f"그래프가 없습니다: {name}"}
+        return 200, ('image/png', await self.read_file(path))
+
+    # ---------- HTTP ----------
+    async def on_connection(self, reader, writer):
+        try:
+            request_line = (await reader.readline()).decode('latin-1').strip()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass  # 헤더는 사용하지 않음
+            try:
+                method, target, _ = request_line.split(' ', 2)
+                status, body = await self.handle(method, target)
+            except Exception as e:
+                status, body = 500, {'error': str(e)}
+
+            if isinstance(body, tuple):
+                content_type, payload = body
+            else:
+                content_type = 'application/json; charset=utf-8'
+                payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+                      405: 'Method Not Allowed', 500: 'Internal Server Error'}[status]
+            header = (f"HTTP/1.1 {status} {reason}\r\nContent-Type: {content_type}\r\n"
+                      f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n")
+            writer.write(header.encode('latin-1') + payload)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8765):
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        server = await asyncio.start_server(self.on_connection, host, port)
+        print(f"🌐 조회 서비스 실행: http://{host}:{port}/memes")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
@@ -1,16 +1,36 @@
 import os
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
-from wordcloud import WordCloud
-from collections import Counter
+
+from src.preprocessors.selenium_twitter_token_counter import SeleniumTwitterTokenCounter
+from src.analyzers.selenium_twitter_survival import survival_durations, kaplan_meier, median_survival
+
+# 한글 폰트 후보: OS 기본 위치 → 없으면 저장소에 포함된 HMKMG.TTF
+FONT_CANDIDATES = {
+    'nt': ["C:/Windows/Fonts/malgun.ttf"],
+    'posix': ["/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+              "/System/Library/Fonts/Supplemental/AppleGothic.ttf"],
+}
+BUNDLED_FONT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'HMKMG.TTF')
+
+
+def find_korean_font():
+    for path in FONT_CANDIDATES.get(os.name, []) + [BUNDLED_FONT_PATH]:
+        if os.path.exists(path):
+            return path
+    return None
 
 
 class SeleniumTwitterVisualizer:
-    def __init__(self, output_dir):
+    def __init__(self, output_dir, font_path=None):
         self.output_dir = output_dir
+        self.font_path = font_path or find_korean_font()
+        if self.font_path is None:
+            print("[⚠️] 한글 폰트를 찾지 못했습니다. 기본 폰트로 시도합니다.")
         os.makedirs(self.output_dir, exist_ok=True)
         plt.style.use('seaborn-v0_8-darkgrid')
         sns.set_palette("husl")
@@ -58,21 +78,24 @@ class SeleniumTwitterVisualizer:
         plt.savefig(path)
         plt.close()
 
-    # 4. 텍스트 클렌징 기반 워드클라우드
-    def plot_wordcloud(self, df):
-        text = ' '.join(df['text_clean'].dropna())
-        if os.name == 'nt':  # Windows
-            font_path = "C:/Windows/Fonts/malgun.ttf"
-        elif os.name == 'posix':  # macOS/Linux
-            font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-        else:
-            print("[⚠️] 알 수 없는 운영체제입니다. 기본 폰트로 시도합니다.")
-            font_path = None   
-
-        wordcloud = WordCloud(width=800, height=400, background_color='white', font_path=font_path).generate(text)
+    # 4. 텍스트 클렌징 기반 워드클라우드 (토큰 빈도 → generate_from_frequencies)
+    def plot_wordcloud(self, df, frequencies=None, max_words=200, title=None):
+        # frequencies를 주면 그 빈도(예: 스냅샷 누적 토큰 빈도)로, 없으면 df만으로 그린다
+        from wordcloud import WordCloud
+
+        if frequencies is None:
+            frequencies = SeleniumTwitterTokenCounter().update(df).top_tokens(max_words)
+        if not frequencies:
+            print("[경고] 단어가 충분하지 않아 워드클라우드를 건너뜁니다.")
+            return
+
+        wordcloud = WordCloud(width=800, height=400, background_color='white', font_path=self.font_path,
+                              max_words=max_words).generate_from_frequencies(frequencies)
         plt.figure(figsize=(10, 5))
         plt.imshow(wordcloud, interpolation='bilinear')
         plt.axis("off")
+        if title:
+            plt.title(title)
         path = os.path.join(self.output_dir, "wordcloud.png")
 
         plt.savefig(path)
@@ -80,27 +103,22 @@ class SeleniumTwitterVisualizer:
 
         
     # 5. 최다 해시태그 상위 N개 바 차트
-    def plot_top_hashtags(self, df, top_n=20):
-        # 한글 폰트 설정
-        if os.name == 'nt':
-            font_path = "C:/Windows/Fonts/malgun.ttf"
-        else:
-            font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-        
-        font_prop = fm.FontProperties(fname=font_path)
-        plt.rcParams['font.family'] = font_prop.get_name()
-    
-        all_tags = df['hashtags'].dropna().tolist()
-        flat_tags = [tag for tags in all_tags for tag in str(tags).split() if tag.startswith('#')]
-        counter = Counter(flat_tags)
-        common = counter.most_common(top_n)
+    def plot_top_hashtags(self, df, top_n=20, hashtag_counts=None, title="Top Hashtags"):
+        # 한글 폰트 설정 (파일에서 직접 등록해야 이름으로 찾을 수 있음)
+        if self.font_path:
+            fm.fontManager.addfont(self.font_path)
+            plt.rcParams['font.family'] = fm.FontProperties(fname=self.font_path).get_name()
+
+        if hashtag_counts is None:
+            hashtag_counts = SeleniumTwitterTokenCounter().update(df).hashtags
+        common = hashtag_counts.most_common(top_n)
         if not common:
             print("[경고] 해시태그가 충분하지 않아 시각화를 건너뜁니다.")
             return
         tags, counts = zip(*common)
         plt.figure(figsize=(10, 5))
         sns.barplot(x=list(counts), y=list(tags))
-        plt.title("Top Hashtags")
+        plt.title(title)
         plt.xlabel("Count")
         path = os.path.join(self.output_dir, "top_hashtags.png")
         plt.savefig(path)
@@ -128,40 +146,38 @@ class SeleniumTwitterVisualizer:
         plt.savefig(path)
         plt.close()
 
-    # 8. 생존 분석 곡선 (Kaplan-Meier)
-    def plot_survival_curve(self, df):
-        try:
-            from lifelines import KaplanMeierFitter
-        except ImportError:
-            print("[에러] lifelines 패키지가 설치되어 있지 않습니다. 생존 분석을 건너뜁니다.")
-            return
-
+    # 8. 생존 분석 곡선 (Kaplan-Meier, 그룹별 일괄 계산)
+    def plot_survival_curve(self, df, group_col=None, collection_time=None):
         if 'created_at' not in df.columns or 'last_seen_at' not in df.columns:
             print("[경고] 생존 분석에 필요한 컬럼이 없습니다.")
-            return
-
-        df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce')
-        df['last_seen_at'] = pd.to_datetime(df['last_seen_at'], errors='coerce')
-        df = df.dropna(subset=['created_at', 'last_seen_at'])
-        df['duration'] = (df['last_seen_at'] - df['created_at']).dt.days
-        df = df[df['duration'] >= 0]
-        df['event_observed'] = 1
+            return None
 
-        if df.empty:
+        durations, events, valid = survival_durations(df, collection_time=collection_time)
+        if len(durations) == 0:
             print("[경고] 유효한 생존 데이터가 없어 시각화를 건너뜁니다.")
-            return
+            return None
 
-        kmf = KaplanMeierFitter()
-        kmf.fit(df['duration'], event_observed=df['event_observed'])
+        groups = df.loc[valid, group_col].to_numpy() if group_col in df.columns else None
+        table = kaplan_meier(durations, events, groups)
+        medians = median_survival(table)
 
         plt.figure(figsize=(8, 5))
-        kmf.plot_survival_function()
+        for group, curve in table.groupby('group', sort=False):
+            # t=0 에서 1.0으로 시작하는 계단 함수
+            times = np.r_[0.0, curve['time'].to_numpy()]
+            probs = np.r_[1.0, curve['survival'].to_numpy()]
+            label = f"{group} (median {medians[group]:.1f}d)" if groups is not None else None
+            plt.step(times, probs, where='post', label=label)
+        if groups is not None:
+            plt.legend()
         plt.title("Survival Curve of Meme (Kaplan-Meier)")
         plt.xlabel("Days")
         plt.ylabel("Survival Probability")
+        plt.ylim(0, 1.05)
         path = os.path.join(self.output_dir, "survival_curve.png")
         plt.savefig(path)
         plt.close()
+        return table
 
     # 9. 좋아요 & 조회수 시간별 추이
     def plot_likes_views_trend(self, df):
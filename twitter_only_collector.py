@@ -12,8 +12,6 @@ import os
 # 현재 파일 기준으로 상위 디렉토리 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
-from utils import create_directories
-from src.collectors.selenium_twitter_collector import SeleniumTwitterCollector
 from src.utils import create_directories
 from config.config import TARGET_MEMES, RAW_DATA_DIR
 
@@ -21,6 +19,9 @@ def collect_twitter_data(meme_name):
     """Twitter에서 밈 데이터 수집"""
     print(f"\n=== Twitter에서 '{meme_name}' 데이터 수집 시작 ===")
     try:
+        # selenium / webdriver_manager는 실제 수집 시점에만 import
+        from src.collectors.selenium_twitter_collector import SeleniumTwitterCollector
+
         collector = SeleniumTwitterCollector(save_dir=RAW_DATA_DIR)
         posts = collector.search_posts(meme_name, max_posts=1000)
         collector.save_posts(posts, meme_name.replace(" ", "_"))